@@ -0,0 +1,107 @@
+from functools import lru_cache
+
+# Composition-aware hit/stand advisor.
+# Works out the expected value (+1 win, 0 push, -1 loss) of standing and of
+# hitting (then playing on optimally) for the player's hand, given the
+# dealer's visible card and the cards the player hasn't seen. Every position
+# is memoized, so repeated queries and shared sub-positions are free.
+# By default card odds stay those of the composition at the decision point:
+# an approximation that costs a few dozen positions per fresh composition, so
+# a query typically takes under a millisecond.
+# With exact=True every card drawn, by the player or the dealer, is removed
+# from the composition, using the exact dealer engine from dealer_odds. That
+# explores up to ~1200 positions per fresh composition (~10 ms typical, up to
+# ~0.25 s), too slow for a query on every card.
+from cards import CARD_CLASS, CLASS_UNIT, VALUE_CLASSES, composition_counts
+from dealer_odds import (BUST_INDEX, DEALER_OUTCOMES, dealer_distribution,
+                         fixed_odds_distribution)
+from hand_states import NEXT_STATE_BY_CLASS, STATE_IS_BUST, STATE_TOTAL
+
+# Positions kept per cache: one exact query needs up to ~1200, a fixed-odds
+# one a few dozen
+CACHE_SIZE = 1 << 13
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _stand_evs(upcard_class, composition, exact):
+    # Stand EV for every player total 0-21 against this dealer card.
+    # The dealer still has to draw the hidden card, so it is part of `composition`.
+    distribution = dealer_distribution if exact else fixed_odds_distribution
+    dealer = distribution(upcard_class + 1, upcard_class == 0, composition)
+    evs = []
+    for player_total in range(22):
+        ev = dealer[BUST_INDEX]
+        for dealer_total, chance in zip(DEALER_OUTCOMES[:BUST_INDEX], dealer):
+            if player_total > dealer_total:
+                ev += chance
+            elif player_total < dealer_total:
+                ev -= chance
+        evs.append(ev)
+    return tuple(evs)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _evs(state, upcard_class, composition, exact):
+    # (stand EV, hit EV) for a player hand state (see hand_states.py) that
+    # hasn't bust
+    stand = _stand_evs(upcard_class, composition, exact)[STATE_TOTAL[state]]
+
+    counts = composition_counts(composition)
+    # Keep at least the hidden card in the pool for the dealer
+    cards_left = sum(counts)
+    if cards_left <= 1:
+        return stand, -1.0
+
+    hit = 0.0
+    for cls in range(VALUE_CLASSES):
+        count = counts[cls]
+        if count == 0:
+            continue
+        new_state = NEXT_STATE_BY_CLASS[state * VALUE_CLASSES + cls]
+        if STATE_IS_BUST[new_state]:
+            hit -= count / cards_left
+            continue
+        remaining = composition - CLASS_UNIT[cls] if exact else composition
+        branch = _evs(new_state, upcard_class, remaining, exact)
+        hit += count / cards_left * max(branch)
+    return stand, hit
+
+
+def hand_evs(player_hand, upcard, composition, exact=False):
+    # EVs of (stand, hit) for a Hand against the dealer's visible card,
+    # drawing from `composition` (the cards the player can't see).
+    if player_hand.is_bust():
+        return -1.0, -1.0
+    return _evs(player_hand.state, CARD_CLASS[upcard], composition, exact)
+
+
+def game_evs(game, exact=False):
+    # EVs of (stand, hit) for the player's current position in a Game21.
+    # The visible dealer card is dealer_hand[1], as in MainWindow.update_dealer_cards.
+    return hand_evs(game.player_hand, game.dealer_hand[1], game.unseen_composition(), exact)
+
+
+def should_hit(game, exact=False):
+    stand, hit = game_evs(game, exact)
+    return hit > stand
+
+
+class OptimalPolicy:
+    # Simulator policy: hit whenever that has the higher expected value
+    def __init__(self, exact=False):
+        self.exact = exact
+
+    def __call__(self, game):
+        return should_hit(game, self.exact)
+
+    def __repr__(self):
+        return f"OptimalPolicy(exact={self.exact})"
+
+
+def cache_info():
+    return _evs.cache_info(), _stand_evs.cache_info()
+
+
+def clear_cache():
+    _evs.cache_clear()
+    _stand_evs.cache_clear()
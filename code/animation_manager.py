@@ -0,0 +1,236 @@
+from PyQt6.QtWidgets import QGraphicsOpacityEffect
+from PyQt6.QtCore import QEasingCurve, QEvent, QObject, QPropertyAnimation, QTimer
+import os
+import time
+import weakref
+
+import perf
+
+# Central scheduler for card animations.
+# Every running card fade is advanced by one shared timer instead of each card
+# owning its own QPropertyAnimation and safety timers. A card only carries a
+# QGraphicsOpacityEffect while it is actually fading: the effect is removed as
+# soon as the card is fully visible, so finished cards paint directly instead
+# of through an offscreen buffer. Only running fades are held, so memory stays
+# bounded however long the session is.
+# Cards drawn as scene items (see table_view.py) go through animate(), which
+# sets the item's own opacity or transform each frame; no effect is needed.
+
+FRAME_INTERVAL_MS = 16
+
+
+class _Fade:
+    def __init__(self, apply, start, end, duration, easing, on_finished, on_complete=None):
+        # apply(value) sets one frame; on_complete runs before on_finished
+        self.apply = apply
+        self.on_complete = on_complete
+        self.start = start
+        self.end = end
+        self.duration = duration / 1000.0
+        self.curve = QEasingCurve(easing)
+        self.on_finished = on_finished
+        self.started = time.perf_counter()
+
+
+class CardAnimator(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._fades = {}
+        self._timer = QTimer(self)
+        self._timer.setInterval(FRAME_INTERVAL_MS)
+        self._timer.timeout.connect(self._tick)
+
+    def fade(self, widget, start, end, duration, easing=QEasingCurve.Type.Linear,
+             on_finished=None):
+        # Fade a widget's opacity from start to end over `duration` ms.
+        # Starting a new fade on a widget replaces any fade already running on it.
+        effect = widget.graphicsEffect()
+        if not isinstance(effect, QGraphicsOpacityEffect):
+            effect = QGraphicsOpacityEffect(widget)
+            widget.setGraphicsEffect(effect)
+        # Fully visible again at the end: drop the effect so it paints directly
+        on_complete = (lambda: widget.setGraphicsEffect(None)) if end >= 1.0 else None
+        self.animate(widget, effect.setOpacity, start, end, duration, easing,
+                     on_finished, on_complete)
+
+    def animate(self, target, apply, start, end, duration, easing=QEasingCurve.Type.Linear,
+                on_finished=None, on_complete=None):
+        # Call apply(value) every frame as value goes from start to end over
+        # `duration` ms. A new animation on a target replaces the running one.
+        apply(start)
+        self._fades[target] = _Fade(apply, start, end, duration, easing, on_finished, on_complete)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def cancel(self, widget):
+        # Stop any fade on the widget and leave it fully visible, without an effect
+        if self._fades.pop(widget, None) is not None or widget.graphicsEffect() is not None:
+            widget.setGraphicsEffect(None)
+
+    def active_count(self):
+        return len(self._fades)
+
+    def _tick(self):
+        with perf.timed("card_animations.tick"):
+            now = time.perf_counter()
+            for widget, fade in list(self._fades.items()):
+                progress = min(1.0, (now - fade.started) / fade.duration)
+                value = fade.start + (fade.end - fade.start) * fade.curve.valueForProgress(progress)
+                try:
+                    fade.apply(value)
+                except RuntimeError:
+                    # The widget (and its effect) was deleted mid-fade
+                    del self._fades[widget]
+                    continue
+                if progress < 1.0:
+                    continue
+
+                del self._fades[widget]
+                if fade.on_complete is not None:
+                    fade.on_complete()
+                if fade.on_finished is not None:
+                    fade.on_finished()
+
+            if not self._fades:
+                self._timer.stop()
+
+
+_animator = None
+
+
+def card_animator():
+    # The process-wide animator, created on first use (it needs a QApplication)
+    global _animator
+    if _animator is None:
+        _animator = CardAnimator()
+    return _animator
+
+
+# PULSING ANIMATIONS
+# The looping pulses on the welcome buttons and the feedback label only run
+# while their window is visible, not minimized and active. In low-power mode
+# they are replaced by a static, fully opaque widget with no effect at all.
+# Low-power mode starts on when LUDO_LOW_POWER is set, and can be toggled.
+
+_low_power = bool(os.environ.get("LUDO_LOW_POWER"))
+_pulses = weakref.WeakSet()
+
+
+def low_power():
+    return _low_power
+
+
+def set_low_power(enabled):
+    global _low_power
+    _low_power = enabled
+    for pulse in list(_pulses):
+        pulse.update_state()
+
+
+class PulseAnimation:
+    # Endless opacity pulse on a widget: start -> peak -> start over `duration` ms
+    def __init__(self, widget, start_value, peak_value, duration=3000):
+        self.widget = widget
+        self.start_value = start_value
+        self.peak_value = peak_value
+        self.duration = duration
+        self.effect = None
+        self.animation = None
+        # Whether the owner wants it pulsing, whether the window allows it,
+        # and whether it has been stopped for good
+        self.wanted = False
+        self.suspended = False
+        self.finished = False
+        _pulses.add(self)
+
+    def start(self):
+        self.wanted = True
+        self.update_state()
+
+    def stop(self):
+        # Stop pulsing and leave the widget fully visible
+        self.wanted = False
+        self.update_state()
+
+    def suspend(self, suspended):
+        # Called by IdleAnimationGuard as the window is hidden/shown/activated
+        self.suspended = suspended
+        self.update_state()
+
+    def shutdown(self):
+        # The window closed: stop for good
+        self.finished = True
+        self.update_state()
+
+    def update_state(self):
+        if self.finished or not self.wanted or _low_power:
+            self._remove()
+        elif self.suspended:
+            if self.animation is not None:
+                self.animation.pause()
+        elif self.animation is None:
+            self._create()
+        elif self.animation.state() == QPropertyAnimation.State.Paused:
+            self.animation.resume()
+
+    def _create(self):
+        self.effect = QGraphicsOpacityEffect(self.widget)
+        self.widget.setGraphicsEffect(self.effect)
+        self.animation = QPropertyAnimation(self.effect, b"opacity")
+        self.animation.setDuration(self.duration)
+        self.animation.setStartValue(self.start_value)
+        self.animation.setKeyValueAt(0.5, self.peak_value)
+        self.animation.setEndValue(self.start_value)
+        self.animation.setEasingCurve(QEasingCurve.Type.InOutSine)
+        self.animation.setLoopCount(-1)  # Loops until paused or removed
+        self.animation.start()
+
+    def _remove(self):
+        # Static style: no animation and no effect, so no offscreen rendering
+        if self.animation is None:
+            return
+        self.animation.stop()
+        self.animation = None
+        self.effect = None
+        try:
+            self.widget.setGraphicsEffect(None)
+        except RuntimeError:
+            pass  # The widget is already gone
+
+
+class IdleAnimationGuard(QObject):
+    # Event filter for a window: suspends its pulses while it is hidden,
+    # minimized or not the active window, and stops them when it closes.
+    # The window may also be a page inside another window (see app_shell.py);
+    # then the top-level window is watched as well once the page is shown.
+    def __init__(self, window, pulses):
+        super().__init__(window)
+        self.window = window
+        self.pulses = list(pulses)
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        kind = event.type()
+        try:
+            if kind == QEvent.Type.Close:
+                for pulse in self.pulses:
+                    pulse.shutdown()
+                return False
+            if kind == QEvent.Type.Show and obj is self.window:
+                top_level = self.window.window()
+                if top_level is not self.window:
+                    top_level.installEventFilter(self)
+            if kind == QEvent.Type.ActivationChange:
+                idle = not self.window.isActiveWindow()
+            elif kind in (QEvent.Type.Show, QEvent.Type.Hide, QEvent.Type.WindowStateChange):
+                # Showing resumes without waiting for activation; losing focus
+                # afterwards still pauses through ActivationChange
+                idle = False
+            else:
+                return False
+            idle = idle or not self.window.isVisible() or self.window.window().isMinimized()
+        except RuntimeError:
+            return False  # The window is being destroyed
+        for pulse in self.pulses:
+            pulse.suspend(idle)
+        return False
@@ -0,0 +1,69 @@
+from PyQt6.QtWidgets import QApplication, QMainWindow, QSizePolicy, QStackedWidget
+
+import startup
+from welcome_window import WelcomeWindow
+
+class AppShell(QMainWindow):
+    # The single top-level window of the app.
+    # The welcome screen and the game are pages in a QStackedWidget: each page
+    # is built once, the first time it is needed, and switching pages only
+    # changes which one is shown.
+    def __init__(self):
+        super().__init__()
+        self.stack = QStackedWidget()
+        self.setCentralWidget(self.stack)
+
+        self.welcome_page = WelcomeWindow(shell=self)
+        self.stack.addWidget(self.welcome_page)
+        # Built on the first "Start Game"
+        self.game_page = None
+
+        self.show_page(self.welcome_page)
+        startup.after_first_paint(self, self.finish_startup)
+
+    def finish_startup(self):
+        # Runs once the welcome page has painted: load what it deferred,
+        # then import the game window module so Start Game doesn't have to
+        startup.mark("first_paint")
+        self.welcome_page.finish_startup()
+        import game_window
+        startup.mark("interactive")
+
+    def show_welcome(self):
+        self.show_page(self.welcome_page)
+
+    def show_game(self):
+        if self.game_page is None:
+            self.welcome_page.finish_startup()
+            # Imported here rather than at the top, so the game window module
+            # stays off the startup path (see startup.py)
+            from game_window import MainWindow
+            self.game_page = MainWindow(shell=self)
+            self.stack.addWidget(self.game_page)
+        self.show_page(self.game_page)
+
+    def show_page(self, page):
+        # Only the current page takes part in sizing, so the window can
+        # shrink back to the welcome screen's size
+        for i in range(self.stack.count()):
+            other = self.stack.widget(i)
+            policy = QSizePolicy.Policy.Preferred if other is page else QSizePolicy.Policy.Ignored
+            other.setSizePolicy(policy, policy)
+        self.stack.setCurrentWidget(page)
+
+        self.setWindowTitle(page.windowTitle())
+        self.setMinimumSize(page.minimumSize())
+        self.resize(page.minimumSize())
+        self.center_on_screen()
+
+    def center_on_screen(self):
+        screen = QApplication.primaryScreen().geometry()
+        window_geometry = self.frameGeometry()
+        window_geometry.moveCenter(screen.center())
+        self.move(window_geometry.topLeft())
+
+    def closeEvent(self, event):
+        # Let every page know the app is closing (stops their animations for good)
+        for i in range(self.stack.count()):
+            self.stack.widget(i).close()
+        super().closeEvent(event)
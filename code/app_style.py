@@ -0,0 +1,34 @@
+from PyQt6.QtWidgets import QApplication
+import os
+
+# Application-wide stylesheet.
+# stylesheet.qss is read from disk once per process and set on the
+# QApplication, so every window shares one parsed style instead of each
+# window reading the file and re-polishing itself on every switch.
+# Per-widget looks that used to be inline setStyleSheet() calls are QSS
+# rules selected by dynamic properties (e.g. QLabel[role="result"]).
+
+STYLESHEET_PATH = os.path.join(os.path.dirname(__file__), "stylesheet.qss")
+
+_stylesheet = None
+
+
+def read_stylesheet():
+    # Stylesheet text, read from disk only the first time
+    global _stylesheet
+    if _stylesheet is None:
+        try:
+            with open(STYLESHEET_PATH, "r") as f:
+                _stylesheet = f.read()
+        except FileNotFoundError:
+            print(f"Warning: Stylesheet file not found at {STYLESHEET_PATH}")
+            _stylesheet = ""
+    return _stylesheet
+
+
+def apply_app_stylesheet():
+    # Set the stylesheet on the QApplication, once
+    app = QApplication.instance()
+    if app is not None and not app.property("ludoStyled"):
+        app.setStyleSheet(read_stylesheet())
+        app.setProperty("ludoStyled", True)
@@ -0,0 +1,191 @@
+import argparse
+import time
+
+import numpy as np
+
+# Vectorized batch engine: shuffles, deals and plays out thousands of rounds
+# at once with NumPy array operations. It follows the same rules as Game21:
+# player gets deck cards 0-1, dealer 2-3, the dealer's visible card is
+# dealer_hand[1], the player draws first, and the dealer hits below 17 with
+# one Ace promoted to 11 whenever it doesn't bust. Hands are tracked as states
+# of the same state machine as Game21's Hand (see hand_states.py), so dealing
+# a card to a whole array of hands is one table lookup.
+from cards import CARD_VALUE, DECK_SIZE
+from game_logic import Game21, PLAYER_BUST, DEALER_BUST, PLAYER_WIN, DEALER_WIN, PUSH
+from hand_states import (EMPTY_STATE, MAX_HARD, NEXT_STATE, STATE_COUNT, STATE_DEALER_STANDS,
+                         STATE_IS_BUST, STATE_IS_SOFT, STATE_TOTAL)
+from shoe import permutations
+from simulator import (BasicStrategyPolicy, SimulationResult, StandOnPolicy,
+                       make_policy, parse_policy, simulate)
+
+UPCARD_VALUES = np.frombuffer(CARD_VALUE, dtype=np.uint8).astype(np.intp)
+
+# The hand state tables as arrays: NEXT_STATES[state * DECK_SIZE + card] is
+# the state after dealing that card
+NEXT_STATES = np.frombuffer(NEXT_STATE, dtype=np.uint8).astype(np.intp)
+STATE_TOTALS = np.frombuffer(STATE_TOTAL, dtype=np.uint8).astype(np.intp)
+STATE_SOFT = np.frombuffer(STATE_IS_SOFT, dtype=np.uint8).astype(np.intp)
+STATE_BUST = np.frombuffer(STATE_IS_BUST, dtype=np.uint8).astype(bool)
+STATE_STANDS = np.frombuffer(STATE_DEALER_STANDS, dtype=np.uint8).astype(bool)
+
+# Totals range over 2..31 at most (hard 21 + a 10), so 32 rows cover them
+MAX_TOTAL = MAX_HARD + 1
+
+
+def policy_table(policy):
+    # Turn a policy into a hit/stand lookup array indexed by
+    # [soft flag, player total, dealer upcard value].
+    # Only table-shaped policies can be vectorized; arbitrary callables can't.
+    policy = make_policy(policy)
+    table = np.zeros((2, MAX_TOTAL, 12), dtype=bool)
+    totals = np.arange(MAX_TOTAL)
+
+    if isinstance(policy, StandOnPolicy):
+        table[:, :, :] = (totals < policy.threshold)[None, :, None]
+        return table
+
+    if isinstance(policy, BasicStrategyPolicy):
+        for soft, strategy in enumerate((policy.hard, policy.soft)):
+            table[soft, :min(strategy), :] = True
+            for total, row in strategy.items():
+                for column, action in enumerate(row):
+                    table[soft, total, column + 2] = action == "H"
+        return table
+
+    raise ValueError(f"Policy {policy!r} can't be vectorized")
+
+
+def state_hit_table(hit_table):
+    # Re-index a policy table by [hand state, dealer upcard value], never
+    # hitting a bust hand, so each player step is a single lookup
+    states = np.arange(STATE_COUNT)[:, None]
+    upcards = np.arange(hit_table.shape[2])[None, :]
+    return hit_table[STATE_SOFT[states], STATE_TOTALS[states], upcards] & ~STATE_BUST[states]
+
+
+def shuffled_decks(rng, count):
+    # One independently shuffled 52-card deck per row. Card codes run 0-51
+    # in a fresh deck, so a permutation of the deck indexes is the deck itself.
+    return permutations(rng, count, DECK_SIZE).astype(np.uint8)
+
+
+def next_states(states, cards):
+    # States after dealing one card to each hand
+    return NEXT_STATES[states * DECK_SIZE + cards]
+
+
+def draw_cards(decks, states, position, active):
+    # Give one card to every active row, in place, from its own deck position
+    rows = np.nonzero(active)[0]
+    cards = decks[rows, position[rows]]
+    states[rows] = next_states(states[rows], cards)
+    position[rows] += 1
+
+
+def play_batch(decks, hit_table):
+    # Play one round per deck row and return the outcome counts
+    count = len(decks)
+
+    state_hits = state_hit_table(hit_table)
+    player_states = next_states(next_states(EMPTY_STATE, decks[:, 0]), decks[:, 1])
+    dealer_states = next_states(next_states(EMPTY_STATE, decks[:, 2]), decks[:, 3])
+    upcards = UPCARD_VALUES[decks[:, 3]]
+    position = np.full(count, 4, dtype=np.intp)
+
+    # Player turn: keep hitting while the policy says so and the hand hasn't bust
+    while True:
+        hitting = state_hits[player_states, upcards]
+        if not hitting.any():
+            break
+        draw_cards(decks, player_states, position, hitting)
+
+    player_bust = STATE_BUST[player_states]
+
+    # Dealer turn: only played when the player is still in, hits below 17
+    while True:
+        hitting = ~STATE_STANDS[dealer_states] & ~player_bust
+        if not hitting.any():
+            break
+        draw_cards(decks, dealer_states, position, hitting)
+
+    player_total = STATE_TOTALS[player_states]
+    dealer_total = STATE_TOTALS[dealer_states]
+    dealer_bust = ~player_bust & STATE_BUST[dealer_states]
+    standing = ~player_bust & ~dealer_bust
+    return {
+        PLAYER_BUST: int(player_bust.sum()),
+        DEALER_BUST: int(dealer_bust.sum()),
+        PLAYER_WIN: int((standing & (player_total > dealer_total)).sum()),
+        DEALER_WIN: int((standing & (dealer_total > player_total)).sum()),
+        PUSH: int((standing & (dealer_total == player_total)).sum()),
+    }
+
+
+def simulate_batch(rounds, policy=17, seed=None, batch_size=100000, rng=None):
+    # Vectorized counterpart of simulator.simulate; returns a SimulationResult
+    hit_table = policy_table(policy)
+    if rng is None:
+        rng = np.random.default_rng(seed)
+
+    result = SimulationResult()
+    start = time.perf_counter()
+    remaining = rounds
+    while remaining > 0:
+        count = min(batch_size, remaining)
+        for outcome, n in play_batch(shuffled_decks(rng, count), hit_table).items():
+            result.counts[outcome] += n
+        remaining -= count
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+# CONSISTENCY CHECK AGAINST THE SCALAR ENGINE
+
+# Chi-square critical value for 4 degrees of freedom (5 outcomes) at p = 0.001
+CHI_SQUARE_CRITICAL = 18.467
+
+
+def chi_square(first, second):
+    # Two-sample chi-square homogeneity statistic over the outcome counts
+    statistic = 0.0
+    total_first, total_second = first.rounds, second.rounds
+    total = total_first + total_second
+    for outcome in first.counts:
+        observed = first.counts[outcome] + second.counts[outcome]
+        if observed == 0:
+            continue
+        for result, size in ((first, total_first), (second, total_second)):
+            expected = observed * size / total
+            statistic += (result.counts[outcome] - expected) ** 2 / expected
+    return statistic
+
+
+def compare_with_scalar(rounds, policy=17, seed=0):
+    # Run both engines from the same seed and test that their outcome
+    # distributions agree. Returns (scalar result, batch result, statistic, agrees).
+    # The batch engine deals every round from a fresh deck, so the scalar game
+    # reshuffles its shoe before every round too (penetration 0).
+    scalar = simulate(rounds, policy, game=Game21(seed=seed, penetration=0))
+    batch = simulate_batch(rounds, policy, seed=seed)
+    statistic = chi_square(scalar, batch)
+    return scalar, batch, statistic, statistic < CHI_SQUARE_CRITICAL
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Vectorized Game of 21 batch simulation.")
+    parser.add_argument("--rounds", type=int, default=1000000)
+    parser.add_argument("--policy", type=parse_policy, default=17,
+                        help="stand-on total (e.g. 17) or 'basic'")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=100000)
+    parser.add_argument("--check", type=int, default=0, metavar="ROUNDS",
+                        help="also compare this many rounds against the scalar engine")
+    args = parser.parse_args()
+
+    print(simulate_batch(args.rounds, args.policy, args.seed, args.batch_size).summary())
+
+    if args.check:
+        seed = 0 if args.seed is None else args.seed
+        scalar, batch, statistic, agrees = compare_with_scalar(args.check, args.policy, seed)
+        print(f"scalar vs batch chi-square: {statistic:.2f} "
+              f"({'consistent' if agrees else 'MISMATCH'}, critical {CHI_SQUARE_CRITICAL})")
@@ -0,0 +1,121 @@
+from PyQt6.QtGui import QImage, QPainter, QPixmap
+from PyQt6.QtCore import Qt, QRect
+import hashlib
+import json
+import os
+
+import perf
+
+# Card sprite atlas: every PNG in assets/cards packed into one image plus a
+# JSON index of where each card sits. Loading the atlas is two file reads
+# instead of one per card image.
+# The index records a hash of the card PNGs it was built from, so a stale
+# atlas can be caught before it ships without the app re-reading every source
+# file at load time. The hash is over file contents rather than modification
+# times, which a git checkout resets.
+#
+# Rebuild it after changing any card image, and check it is up to date:
+#     python tools.py build-atlas
+#     python tools.py check-atlas
+# Compare cold loading with and without the atlas:
+#     python tools.py bench-atlas
+
+CARDS_DIR = os.path.join(os.path.dirname(__file__), "assets", "cards")
+ATLAS_IMAGE = os.path.join(CARDS_DIR, "atlas.png")
+ATLAS_INDEX = os.path.join(CARDS_DIR, "atlas.json")
+ATLAS_VERSION = 2
+ATLAS_COLUMNS = 10
+
+
+def source_files():
+    # Card PNGs that go into the atlas
+    return sorted(name for name in os.listdir(CARDS_DIR)
+                  if name.endswith(".png") and name != os.path.basename(ATLAS_IMAGE))
+
+
+def source_key():
+    # Hash of every source PNG's name and contents
+    digest = hashlib.sha1()
+    for name in source_files():
+        with open(os.path.join(CARDS_DIR, name), "rb") as f:
+            digest.update(name.encode())
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _read_index_file():
+    try:
+        with open(ATLAS_INDEX, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    perf.count("card_images.file_reads")
+    return data if data.get("version") == ATLAS_VERSION else None
+
+
+def read_atlas_index():
+    # filename -> [x, y, width, height], or None if the atlas hasn't been
+    # built. Safe to call from any thread.
+    data = _read_index_file()
+    return None if data is None else data["images"]
+
+
+def atlas_is_current():
+    # Whether the atlas was built from the card PNGs as they are now.
+    # Reads every source file, so it's for tools.py, not the app.
+    data = _read_index_file()
+    return data is not None and data.get("sources") == source_key()
+
+
+class CardAtlas:
+    def __init__(self, pixmap, index):
+        self.pixmap = pixmap
+        # filename -> [x, y, width, height] inside the atlas
+        self.index = index
+
+    @classmethod
+    def load(cls):
+        # Returns the atlas, or None if it hasn't been built
+        index = read_atlas_index()
+        if index is None:
+            return None
+
+        pixmap = QPixmap(ATLAS_IMAGE)
+        perf.count("card_images.file_reads")
+        if pixmap.isNull():
+            return None
+        return cls(pixmap, index)
+
+    def image(self, filename):
+        # Unscaled sub-image for one card file, or None if it isn't in the atlas
+        rect = self.index.get(filename)
+        if rect is None:
+            return None
+        return self.pixmap.copy(QRect(*rect))
+
+
+def build_atlas():
+    # Pack every card PNG into ATLAS_IMAGE and write ATLAS_INDEX
+    names = source_files()
+    images = [QImage(os.path.join(CARDS_DIR, name)) for name in names]
+    cell_width = max(image.width() for image in images)
+    cell_height = max(image.height() for image in images)
+    rows = (len(images) + ATLAS_COLUMNS - 1) // ATLAS_COLUMNS
+
+    atlas = QImage(cell_width * ATLAS_COLUMNS, cell_height * rows,
+                   QImage.Format.Format_ARGB32_Premultiplied)
+    atlas.fill(Qt.GlobalColor.transparent)
+
+    index = {}
+    painter = QPainter(atlas)
+    for i, (name, image) in enumerate(zip(names, images)):
+        x = (i % ATLAS_COLUMNS) * cell_width
+        y = (i // ATLAS_COLUMNS) * cell_height
+        painter.drawImage(x, y, image)
+        index[name] = [x, y, image.width(), image.height()]
+    painter.end()
+
+    atlas.save(ATLAS_IMAGE, "PNG")
+    with open(ATLAS_INDEX, "w") as f:
+        json.dump({"version": ATLAS_VERSION, "sources": source_key(), "images": index}, f, indent=1)
+    return len(index)
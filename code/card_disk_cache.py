@@ -0,0 +1,117 @@
+from PyQt6.QtGui import QImage
+from PyQt6.QtCore import QStandardPaths
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+import perf
+from card_atlas import CARDS_DIR
+
+# On-disk cache of card images that are already decoded and scaled.
+# One file per (size bucket, DPR) holds the raw premultiplied ARGB32 pixels of
+# every cached card, so a later run memory-maps it and copies the pixels
+# straight into QImages: no PNG decode and no smooth scaling at all.
+# Each file records a key built from CACHE_VERSION and the size and
+# modification time of every file in assets/cards. When a card image (or the
+# atlas) changes, the key no longer matches and the file is rebuilt the next
+# time that bucket is loaded normally.
+#
+# The cache lives in the user's cache directory, or LUDO_CACHE_DIR if set.
+# Compare cold loading with and without it:
+#     python tools.py bench-disk-cache
+
+CACHE_VERSION = 1
+MAGIC = b"LUDOCARD"
+IMAGE_FORMAT = QImage.Format.Format_ARGB32_Premultiplied
+
+
+def cache_dir():
+    path = os.environ.get("LUDO_CACHE_DIR")
+    if not path:
+        base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation)
+        path = os.path.join(base or os.path.expanduser("~/.cache"), "ludo")
+    return path
+
+
+def cache_path(bucket, dpr):
+    return os.path.join(cache_dir(), f"cards-{bucket}-{dpr:.2f}.bin")
+
+
+def source_key():
+    # Changes whenever a source image is added, removed or modified
+    digest = hashlib.sha1(f"v{CACHE_VERSION}".encode())
+    for name in sorted(os.listdir(CARDS_DIR)):
+        stat = os.stat(os.path.join(CARDS_DIR, name))
+        digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()
+
+
+def read_cache(bucket, dpr, key=None):
+    # filename -> QImage for one bucket, or None if there is no file or it's
+    # stale. A damaged file (empty, truncated, unreadable) counts as stale:
+    # this runs on the GUI thread too, where an exception would abort the app.
+    # Safe to call from any thread.
+    try:
+        with open(cache_path(bucket, dpr), "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            perf.count("card_images.file_reads")
+            return _read_images(data, dpr, key)
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def _read_images(data, dpr, key):
+    if data[:len(MAGIC)] != MAGIC:
+        return None
+    header_size, = struct.unpack_from("<I", data, len(MAGIC))
+    start = len(MAGIC) + 4
+    if start + header_size > len(data):
+        return None
+    header = json.loads(bytes(data[start:start + header_size]))
+    if header.get("key") != (key or source_key()):
+        return None
+
+    images = {}
+    with memoryview(data) as view:
+        for filename, (offset, width, height) in header["images"].items():
+            image = QImage(width, height, IMAGE_FORMAT)
+            size = image.sizeInBytes()
+            if image.isNull() or offset < start + header_size or offset + size > len(data):
+                return None
+            pixels = image.bits()
+            pixels.setsize(size)
+            pixels[0:size] = view[offset:offset + size]
+            image.setDevicePixelRatio(dpr)
+            images[filename] = image
+    return images
+
+
+def write_cache(bucket, dpr, images, key=None):
+    # Store filename -> QImage for one bucket, replacing any older file.
+    # Safe to call from any thread.
+    images = {name: image.convertToFormat(IMAGE_FORMAT) for name, image in images.items()}
+    index = {}
+    header = b""
+    # The header holds the offsets, whose digits can change its length, so
+    # settle the layout first
+    for _ in range(3):
+        offset = len(MAGIC) + 4 + len(header)
+        index = {}
+        for name, image in images.items():
+            index[name] = [offset, image.width(), image.height()]
+            offset += image.sizeInBytes()
+        header = json.dumps({"key": key or source_key(), "images": index}).encode()
+
+    path = cache_path(bucket, dpr)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for image in images.values():
+            f.write(image.constBits().asstring(image.sizeInBytes()))
+    # Readers see either the old file or the complete new one
+    os.replace(temp_path, path)
@@ -1,183 +1,421 @@
 from PyQt6.QtWidgets import QLabel
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer
+from PyQt6.QtCore import Qt, QCoreApplication, QEasingCurve
 from PyQt6.QtGui import QPixmap
 import os
 
+import perf
+from animation_manager import card_animator
+from card_atlas import CARDS_DIR, CardAtlas
+from card_disk_cache import read_cache, write_cache
+from cards import CARD_IMAGE, IMAGE_TO_CARD, TEXT_TO_CARD, card_text
+from table_view import CardItem, TableHand
+
+# Cards are shown at 85% of their source image size in the default 600x700
+# window, and grow with the window up to MAX_CARD_SCALE
+CARD_SCALE = 0.85
+MAX_CARD_SCALE = 1.5
+BASE_WINDOW_WIDTH = 600
+BASE_WINDOW_HEIGHT = 700
+
+# Card scales are rounded to steps of SCALE_STEP ("size buckets"), so resizing
+# the window only rescales the cards when it crosses into another bucket
+SCALE_STEP = 0.05
+
+
+def size_bucket(scale):
+    return max(1, round(scale / SCALE_STEP))
+
+
+def card_size_bucket(width, height):
+    # Size bucket for cards in a game window of this size
+    factor = min(width / BASE_WINDOW_WIDTH, height / BASE_WINDOW_HEIGHT)
+    return size_bucket(min(MAX_CARD_SCALE, CARD_SCALE * max(1.0, factor)))
+
+
+DEFAULT_BUCKET = size_bucket(CARD_SCALE)
+
+
+class CardPixmapCache:
+    # Process-wide cache of decoded, pre-scaled card pixmaps.
+    # Each image is read from disk once and smooth-scaled once per size bucket
+    # and device pixel ratio, then reused by every CardDisplay. Faces are keyed
+    # by (card code, bucket, DPR), backs by (filename, bucket, DPR), so changing
+    # the back style only throws away back entries.
+    # Pixmaps are scaled to physical pixels and tagged with their DPR, so
+    # HiDPI screens get full-resolution cards that Qt draws without rescaling.
+    # Source images come from the card atlas (see card_atlas.py) when many
+    # are loaded at once (preload); a single card on demand reads its own PNG,
+    # since decoding the whole atlas for it would take ~100 times as long.
+    # Scaled images are also kept on disk between runs (see card_disk_cache.py):
+    # the first miss for a bucket loads that bucket's file, and buckets where
+    # anything had to be decoded are written back when the app quits.
+    def __init__(self, use_atlas=True, use_disk_cache=True):
+        self._faces = {}
+        self._backs = {}
+        # Unscaled source images, so another bucket doesn't read them again
+        self._sources = {}
+        # None until the first bulk load; False if there is no usable atlas
+        self._atlas = None if use_atlas else False
+        self.use_disk_cache = use_disk_cache
+        # (bucket, DPR) whose disk file was read, and those with images the
+        # file doesn't have yet
+        self._disk_loaded = set()
+        self._disk_dirty = set()
+        self._save_on_quit = False
+
+    def source(self, filename):
+        # Unscaled image for a card file, from the atlas if possible
+        pixmap = self._sources.get(filename)
+        if pixmap is not None:
+            return pixmap
+        if self._atlas:
+            pixmap = self._atlas.image(filename)
+        if pixmap is None:
+            perf.count("card_images.file_reads")
+            pixmap = QPixmap(os.path.join(CARDS_DIR, filename))
+        self._sources[filename] = pixmap
+        return pixmap
+
+    def load_atlas(self):
+        # Read the whole atlas, so the images loaded next come out of it
+        if self._atlas is None:
+            self._atlas = CardAtlas.load() or False
+
+    def load(self, filename, bucket=DEFAULT_BUCKET, dpr=1.0):
+        # Decode and scale one image; returns a null QPixmap if it can't be read
+        with perf.timed("card_images.load"):
+            pixmap = self.source(filename)
+            if pixmap.isNull():
+                return pixmap
+            return self.scaled(pixmap, bucket, dpr)
+
+    def scaled(self, image, bucket=DEFAULT_BUCKET, dpr=1.0):
+        # Scale a QPixmap, or a QImage (which can be done off the GUI thread)
+        scale = bucket * SCALE_STEP * dpr
+        scaled = image.scaled(
+            int(image.width() * scale),
+            int(image.height() * scale),
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        scaled.setDevicePixelRatio(dpr)
+        return scaled
+
+    def _key(self, filename, bucket, dpr):
+        # (card code or back filename, bucket, DPR) for one cache entry
+        card = IMAGE_TO_CARD.get(filename)
+        return (filename if card is None else card, bucket, round(dpr, 2))
+
+    def _entries(self, filename):
+        return self._backs if filename not in IMAGE_TO_CARD else self._faces
+
+    def get(self, filename, bucket=DEFAULT_BUCKET, dpr=1.0):
+        key = self._key(filename, bucket, dpr)
+        entries = self._entries(filename)
+        pixmap = entries.get(key)
+        if pixmap is None and self.use_disk_cache and key[1:] not in self._disk_loaded:
+            self.load_disk_cache(bucket, dpr)
+            pixmap = entries.get(key)
+        if pixmap is None:
+            pixmap = self.load(filename, bucket, dpr)
+            entries[key] = pixmap
+            if self.use_disk_cache and not pixmap.isNull():
+                self._mark_dirty(bucket, dpr)
+        return pixmap
+
+    def face(self, card, bucket=DEFAULT_BUCKET, dpr=1.0):
+        return self.get(CARD_IMAGE[card], bucket, dpr)
+
+    def back(self, card_back_style, bucket=DEFAULT_BUCKET, dpr=1.0):
+        return self.get(card_back_style, bucket, dpr)
+
+    def contains(self, filename, bucket=DEFAULT_BUCKET, dpr=1.0):
+        return self._key(filename, bucket, dpr) in self._entries(filename)
+
+    def put(self, filename, image, bucket=DEFAULT_BUCKET, dpr=1.0):
+        # Store an image that was already decoded and scaled elsewhere
+        # (see preloader.py); only the conversion to QPixmap happens here
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(dpr)
+        self._entries(filename)[self._key(filename, bucket, dpr)] = pixmap
+
+    def preload(self, card_back_styles=(), bucket=DEFAULT_BUCKET, dpr=1.0):
+        # Warm every face plus the given backs ahead of the first deal
+        filenames = list(CARD_IMAGE) + list(card_back_styles)
+        if self.use_disk_cache and (bucket, round(dpr, 2)) not in self._disk_loaded:
+            self.load_disk_cache(bucket, dpr)
+        if not all(self.contains(filename, bucket, dpr) for filename in filenames):
+            self.load_atlas()
+        for filename in filenames:
+            self.get(filename, bucket, dpr)
+        self.save_disk_caches()
+
+    # DISK CACHE
+
+    def load_disk_cache(self, bucket=DEFAULT_BUCKET, dpr=1.0):
+        # Fill one bucket from its disk file; False if it's missing or stale
+        return self.add_disk_images(read_cache(bucket, dpr), bucket, dpr)
+
+    def add_disk_images(self, images, bucket=DEFAULT_BUCKET, dpr=1.0):
+        # Same, for what read_cache() returned on another thread
+        self._disk_loaded.add((bucket, round(dpr, 2)))
+        if images is None:
+            return False
+        for filename, image in images.items():
+            if not self.contains(filename, bucket, dpr):
+                self.put(filename, image, bucket, dpr)
+        perf.count("card_images.disk_cache_hits")
+        return True
+
+    def _mark_dirty(self, bucket, dpr):
+        self._disk_dirty.add((bucket, round(dpr, 2)))
+        app = QCoreApplication.instance()
+        if not self._save_on_quit and app is not None:
+            app.aboutToQuit.connect(self.save_disk_caches)
+            self._save_on_quit = True
+
+    def disk_cache_images(self, bucket=DEFAULT_BUCKET, dpr=1.0):
+        # filename -> QImage of everything cached for one bucket
+        key = (bucket, round(dpr, 2))
+        images = {}
+        for (card, *rest), pixmap in self._faces.items():
+            if tuple(rest) == key and not pixmap.isNull():
+                images[CARD_IMAGE[card]] = pixmap.toImage()
+        for (filename, *rest), pixmap in self._backs.items():
+            if tuple(rest) == key and not pixmap.isNull():
+                images[filename] = pixmap.toImage()
+        return images
+
+    def disk_cache_saved(self, bucket=DEFAULT_BUCKET, dpr=1.0):
+        self._disk_dirty.discard((bucket, round(dpr, 2)))
+
+    def save_disk_caches(self):
+        # Write every bucket that had to decode images since it was loaded
+        for bucket, dpr in list(self._disk_dirty):
+            try:
+                write_cache(bucket, dpr, self.disk_cache_images(bucket, dpr))
+            except OSError as e:
+                print(f"Warning: could not write card cache: {e}")
+            self.disk_cache_saved(bucket, dpr)
+
+    def invalidate_backs(self):
+        self._backs.clear()
+
+    def clear(self):
+        self._faces.clear()
+        self._backs.clear()
+        self._sources.clear()
+        self._disk_loaded.clear()
+        self._disk_dirty.clear()
+
+# Shared by every CardDisplay in the process
+pixmap_cache = CardPixmapCache()
+
+# Back shown until the player picks another one from the Card Back menu
+DEFAULT_CARD_BACK = "cardBack_red2.png"
+
+# Most hidden card labels kept around for reuse; extras are deleted
+MAX_POOLED_LABELS = 32
+
 class CardDisplay:
-    def __init__(self, card_back_style="cardBack_red2.png"):
+    def __init__(self, card_back_style=DEFAULT_CARD_BACK, sounds=None):
         self.card_back_style = card_back_style
-        # Store animations to prevent garbage collection
-        self._animations = []
-
+        # SoundEffects for deals and flips (see sound_effects.py); None is silent
+        self.sounds = sounds
+        # Hidden card labels waiting to be reused, and how many were ever created
+        self._label_pool = []
+        self.labels_allocated = 0
+        # Size bucket and device pixel ratio the cards are rendered at
+        self.size_bucket = DEFAULT_BUCKET
+        self.dpr = 1.0
+    
+    def set_card_size(self, bucket, dpr):
+        # Render cards for another size bucket / DPR from now on.
+        # Returns True if that changed, so the caller can refresh shown cards.
+        if (bucket, dpr) == (self.size_bucket, self.dpr):
+            return False
+        self.size_bucket = bucket
+        self.dpr = dpr
+        return True
 
-    def get_card_image_path(self, card_text):
-        # Convert card text like 'A♠' to image filename like 'cardSpadesA.png'
-        if card_text == "??":
+    def get_card_image_path(self, card):
+        # Convert a card code (or text like 'A♠') to its image path, e.g. 'cardSpadesA.png'
+        if card == "??":
             # Use selected card back style
-            return os.path.join(os.path.dirname(__file__), "assets", "cards", self.card_back_style)
-        
-        # Extract rank and suit from card text
-        rank = card_text[:-1]  # Everything except last character
-        suit_symbol = card_text[-1]  # Last character is the suit
+            return os.path.join(CARDS_DIR, self.card_back_style)
         
-        # Map suit symbols to names (capitalized)
-        suit_map = {
-            '♠': 'Spades',
-            '♥': 'Hearts',
-            '♦': 'Diamonds',
-            '♣': 'Clubs'
-        }
+        # Text cards are still accepted, but are mapped back to their code first
+        if isinstance(card, str):
+            card = TEXT_TO_CARD[card]
         
-        suit_name = suit_map.get(suit_symbol, 'Spades')
-        
-        # New format: cardSpadesA.png, cardHearts10.png, etc.
-        filename = f"card{suit_name}{rank}.png"
-        return os.path.join(os.path.dirname(__file__), "assets", "cards", filename)
+        # Filenames come from a table: cardSpadesA.png, cardHearts10.png, etc.
+        return os.path.join(CARDS_DIR, CARD_IMAGE[card])
+    
+    def get_card_pixmap(self, card):
+        # Cached, already scaled pixmap for a card code, text card or "??" (back)
+        if card == "??":
+            return pixmap_cache.back(self.card_back_style, self.size_bucket, self.dpr)
+        if isinstance(card, str):
+            card = TEXT_TO_CARD[card]
+        return pixmap_cache.face(card, self.size_bucket, self.dpr)
+    
+    def card_label_text(self, card):
+        # Text fallback shown when a card image can't be loaded
+        if isinstance(card, int):
+            return card_text(card)
+        return card
+    
+    # LABEL POOL
+    
+    def acquire_label(self):
+        # Reuse a hidden card label if one is pooled, otherwise create one
+        if self._label_pool:
+            return self._label_pool.pop()
+        label = QLabel()
+        label.setObjectName("cardLabel")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setProperty("card", True)
+        self.labels_allocated += 1
+        perf.count("card_labels.allocated")
+        return label
+    
+    def release_label(self, label):
+        # Hide a card label and keep it for the next add_card.
+        # It stays parented to its cards widget until a layout adopts it again.
+        # (Scene items are just taken off the table.)
+        card_animator().cancel(label)
+        if isinstance(label, CardItem):
+            if label.hand is not None:
+                label.hand.remove(label)
+            return
+        label.hide()
+        if len(self._label_pool) < MAX_POOLED_LABELS:
+            self._label_pool.append(label)
+        else:
+            label.setParent(None)
+            label.deleteLater()
+    
+    def pool_size(self):
+        # Number of idle labels ready for reuse
+        return len(self._label_pool)
     
     def clear_layout(self, layout):
-        # Remove all widgets and spacers from a layout
+        # Remove all widgets and spacers from a layout.
+        # Card labels go back to the pool instead of being destroyed.
+        if isinstance(layout, TableHand):
+            for item in list(layout.items):
+                self.release_label(item)
+            return
         if layout is not None:
             while layout.count():
                 item = layout.takeAt(0)
                 if item.widget():
                     widget = item.widget()
-                    widget.setParent(None)
-                    widget.deleteLater()
+                    if widget.property("card"):
+                        self.release_label(widget)
+                    else:
+                        widget.setParent(None)
+                        widget.deleteLater()
                 elif item.layout():
                     self.clear_layout(item.layout())
     
-    def add_card(self, layout, card_text, animate=True):
-        # Create a QLabel showing the card image and add it to the chosen layout.
-        label = QLabel()
-        label.setObjectName("cardLabel")
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Load the card image
-        card_path = self.get_card_image_path(card_text)
-        pixmap = QPixmap(card_path)
+    def set_card_image(self, label, card):
+        # Show a card on an existing label, in place.
+        # Card image, decoded once per process and scaled once per size bucket
+        pixmap = self.get_card_pixmap(card)
         if not pixmap.isNull():
-            # Scale the card to 85% of original size
-            scaled_pixmap = pixmap.scaled(
-                int(pixmap.width() * 0.85), 
-                int(pixmap.height() * 0.85),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            label.setPixmap(scaled_pixmap)
+            label.setPixmap(pixmap)
         else:
             # Fallback to text if image not found
-            label.setText(card_text)
+            label.setText(self.card_label_text(card))
+    
+    def add_card(self, layout, card, animate=True):
+        # Show the card image in a (pooled) QLabel added to the chosen layout,
+        # or as an item in a TableHand of a scene table (see table_view.py).
+        if isinstance(layout, TableHand):
+            return self.add_table_card(layout, card, animate)
+        label = self.acquire_label()
+        self.set_card_image(label, card)
         
         layout.addWidget(label)
-        label.setProperty("card", True)
         
         # Ensure label is visible first
         label.show()
         
         # Animate the card if requested
         if animate:
-            # Use a small delay to ensure widget is laid out before animating
-            QTimer.singleShot(10, lambda: self.animate_card_deal(label))
+            self.animate_card_deal(label)
         else:
             # Without animation, ensure it's fully visible
-            label.setStyleSheet("")  # Clear any opacity effects
+            card_animator().cancel(label)
         
         return label
     
+    def add_table_card(self, hand, card, animate=True):
+        item = CardItem()
+        self.set_card_image(item, card)
+        hand.add(item)
+        if animate:
+            self.animate_card_deal(item)
+        return item
+    
     def animate_card_deal(self, label):
-        # Animate card being dealt: fade in
-        from PyQt6.QtWidgets import QGraphicsOpacityEffect
-        
-        # Ensure label is visible and has a parent
-        if label.parent() is None:
+        # Animate card being dealt: fade in from transparent.
+        # All card fades run on the shared animator, which removes the
+        # opacity effect again once the card is fully visible.
+        # Scene items fade their own opacity instead.
+        if isinstance(label, CardItem):
+            if self.sounds is not None:
+                self.sounds.play("deal")
+            card_animator().animate(label, label.setOpacity, 0.0, 1.0, 400,
+                                    QEasingCurve.Type.OutCubic)
+            return
+        if label.parent() is None or label.isHidden():
             return  # Can't animate without parent
         
-        label.show()
-        
-        opacity_effect = QGraphicsOpacityEffect(label)
-        label.setGraphicsEffect(opacity_effect)
-        
-        # Set initial state: transparent
-        opacity_effect.setOpacity(0.0)
-        
-        # Create opacity animation
-        opacity_anim = QPropertyAnimation(opacity_effect, b"opacity")
-        opacity_anim.setDuration(400)
-        opacity_anim.setStartValue(0.0)
-        opacity_anim.setEndValue(1.0)
-        opacity_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-        
-        # Store animation to prevent garbage collection
-        self._animations.append(opacity_anim)
-        
-        # Clean up old animations (keep only last 10)
-        if len(self._animations) > 10:
-            self._animations.pop(0)
-        
-        # Safety fallback: ensure card is visible after animation duration
-        def ensure_visible():
-            if opacity_effect.opacity() < 0.1:
-                opacity_effect.setOpacity(1.0)
-        
-        QTimer.singleShot(500, ensure_visible)
-        
-        # Start the animation
-        opacity_anim.start()
+        if self.sounds is not None:
+            self.sounds.play("deal")
+        card_animator().fade(label, 0.0, 1.0, 400, QEasingCurve.Type.OutCubic)
     
-    def animate_card_flip(self, label, new_card_text):
+    def animate_card_flip(self, label, new_card):
         # Animate card being flipped: opacity fade out, change image, fade in
-        from PyQt6.QtWidgets import QGraphicsOpacityEffect
-        
+        if isinstance(label, CardItem):
+            self.animate_item_flip(label, new_card)
+            return
         if label.parent() is None:
             return  # Can't animate without parent
         
-        opacity_effect = label.graphicsEffect()
-        if opacity_effect is None:
-            opacity_effect = QGraphicsOpacityEffect(label)
-            label.setGraphicsEffect(opacity_effect)
-            opacity_effect.setOpacity(1.0)
+        animator = card_animator()
+        if self.sounds is not None:
+            self.sounds.play("flip")
         
-        # Fade out
-        fade_out = QPropertyAnimation(opacity_effect, b"opacity")
-        fade_out.setDuration(150)
-        fade_out.setStartValue(1.0)
-        fade_out.setEndValue(0.0)
-        fade_out.setEasingCurve(QEasingCurve.Type.InQuad)
-        
-        # Change card image when fade out completes
+        # Change card image when fade out completes, then fade back in
         def change_card_image():
-            card_path = self.get_card_image_path(new_card_text)
-            pixmap = QPixmap(card_path)
-            if not pixmap.isNull():
-                # Scale the card to 85% of original size
-                scaled_pixmap = pixmap.scaled(
-                    int(pixmap.width() * 0.85), 
-                    int(pixmap.height() * 0.85),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                label.setPixmap(scaled_pixmap)
-            else:
-                label.setText(new_card_text)
-        
-        # Fade in
-        fade_in = QPropertyAnimation(opacity_effect, b"opacity")
-        fade_in.setDuration(150)
-        fade_in.setStartValue(0.0)
-        fade_in.setEndValue(1.0)
-        fade_in.setEasingCurve(QEasingCurve.Type.OutQuad)
+            if label.isHidden():
+                return  # Label went back to the pool mid-flip
+            self.set_card_image(label, new_card)
+            animator.fade(label, 0.0, 1.0, 150, QEasingCurve.Type.OutQuad)
         
-        # Store animations to prevent garbage collection
-        self._animations.append(fade_out)
-        self._animations.append(fade_in)
+        animator.fade(label, 1.0, 0.0, 150, QEasingCurve.Type.InQuad,
+                      on_finished=change_card_image)
+    
+    def animate_item_flip(self, item, new_card):
+        # Scene items turn over for real: squash to edge-on, change image, unsquash
+        animator = card_animator()
+        if self.sounds is not None:
+            self.sounds.play("flip")
         
-        # Chain animations
-        fade_out.finished.connect(change_card_image)
-        fade_out.finished.connect(fade_in.start)
+        def change_card_image():
+            if item.isHidden():
+                return  # Taken off the table mid-flip
+            self.set_card_image(item, new_card)
+            animator.animate(item, item.set_flip, 0.0, 1.0, 150, QEasingCurve.Type.OutQuad)
         
-        # Start the animation
-        fade_out.start()
+        animator.animate(item, item.set_flip, 1.0, 0.0, 150, QEasingCurve.Type.InQuad,
+                         on_finished=change_card_image)
     
     def set_card_back_style(self, card_back_file):
-        # Change the card back style
+        # Change the card back style; cached faces stay, only backs are dropped
+        if card_back_file != self.card_back_style:
+            pixmap_cache.invalidate_backs()
         self.card_back_style = card_back_file
@@ -0,0 +1,60 @@
+from array import array
+
+# Compact card encoding shared by the game logic and the UI.
+# A card is a small int 0-51: rank index * 4 + suit index, in the same
+# order create_deck used to build its strings (A, 2-10, J, Q, K x ♠ ♥ ♦ ♣).
+# Text like 'A♠' is only produced at the edge, when the UI needs it.
+
+RANKS = ["A"] + [str(n) for n in range(2, 11)] + ["J", "Q", "K"]
+SUITS = ["♠", "♥", "♦", "♣"]
+SUIT_NAMES = ["Spades", "Hearts", "Diamonds", "Clubs"]
+
+DECK_SIZE = len(RANKS) * len(SUITS)
+
+# Lookup tables indexed by card code
+# - CARD_RANK: index into RANKS
+# - CARD_VALUE: blackjack value with the Ace counted as 11
+# - CARD_HARD_VALUE: blackjack value with the Ace counted as 1
+# - CARD_IS_ACE: 1 for aces, 0 otherwise
+CARD_RANK = bytes(code // len(SUITS) for code in range(DECK_SIZE))
+CARD_VALUE = bytes(11 if rank == 0 else min(rank + 1, 10) for rank in CARD_RANK)
+CARD_HARD_VALUE = bytes(1 if rank == 0 else min(rank + 1, 10) for rank in CARD_RANK)
+CARD_IS_ACE = bytes(1 if rank == 0 else 0 for rank in CARD_RANK)
+
+# Shoe composition: cards are grouped into 10 value classes (A, 2-9, ten-valued)
+# and the count of each class is packed into one int, COMPOSITION_BITS per class.
+# Drawing a card just subtracts its CARD_CLASS_UNIT, and the int doubles as a
+# compact, hashable cache key.
+VALUE_CLASSES = 10
+COMPOSITION_BITS = 10
+COMPOSITION_MASK = (1 << COMPOSITION_BITS) - 1
+CARD_CLASS = bytes(value - 1 for value in CARD_HARD_VALUE)
+CLASS_UNIT = tuple(1 << (COMPOSITION_BITS * cls) for cls in range(VALUE_CLASSES))
+CARD_CLASS_UNIT = tuple(CLASS_UNIT[cls] for cls in CARD_CLASS)
+
+# Edge tables for the UI: display text and image filename per card code
+CARD_TEXT = tuple(f"{rank}{suit}" for rank in RANKS for suit in SUITS)
+CARD_IMAGE = tuple(f"card{suit}{rank}.png" for rank in RANKS for suit in SUIT_NAMES)
+TEXT_TO_CARD = {text: code for code, text in enumerate(CARD_TEXT)}
+IMAGE_TO_CARD = {name: code for code, name in enumerate(CARD_IMAGE)}
+
+
+def new_deck():
+    # A fresh, ordered 52-card deck as a compact byte array of card codes
+    return array("B", range(DECK_SIZE))
+
+
+def card_text(card):
+    # Convert a card code into its display text, e.g. 0 -> 'A♠'
+    return CARD_TEXT[card]
+
+
+def composition_of(cards):
+    # Packed composition key for a collection of card codes
+    return sum(CARD_CLASS_UNIT[card] for card in cards)
+
+
+def composition_counts(composition):
+    # Unpack a composition key into a list of 10 counts (A, 2, ..., 9, ten-valued)
+    return [(composition >> (COMPOSITION_BITS * cls)) & COMPOSITION_MASK
+            for cls in range(VALUE_CLASSES)]
@@ -0,0 +1,141 @@
+from functools import lru_cache
+
+# Exact distribution of the dealer's final total, following the same rule as
+# Game21.play_dealer_turn: hit while the total is below 17, with one Ace
+# counted as 11 whenever that doesn't bust. Cards are drawn without
+# replacement from a shoe composition (a packed key from cards.py).
+#
+# The outcome only depends on which cards the dealer draws, not their order.
+# Drawing k_c cards of each value class c, K in all, in one given order from a
+# composition holding n_c of each (N in all) has probability
+#     prod_c n_c (n_c - 1) ... (n_c - k_c + 1) / (N (N - 1) ... (N - K + 1))
+# So for each starting hand state a table lists every multiset of draws that
+# ends the dealer's turn, how many draw orders lead to it, and its outcome.
+# The tables don't depend on the composition: each is built once (a few ms),
+# and a query is one vectorized sum over its ~200-2000 rows (~0.1 ms, about
+# 10,000 queries a second). NumPy is only imported when the first table is
+# built.
+from cards import VALUE_CLASSES, composition_counts
+from hand_states import (NEXT_STATE_BY_CLASS, STATE_DEALER_STANDS, STATE_TOTAL, hand_state,
+                         state_of)
+
+# Index of each final outcome in a distribution tuple
+DEALER_OUTCOMES = (17, 18, 19, 20, 21, "bust")
+BUST_INDEX = 5
+
+# Recent (hand state, composition) queries kept, at ~0.3 KB each
+CACHE_SIZE = 1 << 12
+
+# Hand state -> (draw counts per class, draw orders, outcome index) arrays
+_tables = {}
+
+
+def _outcome(total):
+    # Index in DEALER_OUTCOMES for a dealer who has stopped drawing.
+    # A dealer left below 17 only happens when the shoe runs dry; count it as
+    # the lowest standing total.
+    return BUST_INDEX if total > 21 else max(total, 17) - 17
+
+
+def _final(total):
+    # One-hot distribution for a dealer who has stopped drawing
+    result = [0.0] * len(DEALER_OUTCOMES)
+    result[_outcome(total)] = 1.0
+    return tuple(result)
+
+
+def _table(state):
+    # Every way a dealer in `state` can finish, as NumPy arrays: draws per
+    # class, total draws, number of draw orders and outcome index per row.
+    # Hands still drawing are keyed by their multiset of draws, which fixes
+    # their hand state, so each is expanded once.
+    table = _tables.get(state)
+    if table is not None:
+        return table
+    import numpy as np
+    drawing = {(0,) * VALUE_CLASSES: (state, 1)}
+    finished = {}
+    while drawing:
+        next_drawing = {}
+        for drawn, (hand, orders) in drawing.items():
+            for cls in range(VALUE_CLASSES):
+                next_drawn = drawn[:cls] + (drawn[cls] + 1,) + drawn[cls + 1:]
+                next_hand = NEXT_STATE_BY_CLASS[hand * VALUE_CLASSES + cls]
+                if STATE_DEALER_STANDS[next_hand]:
+                    key = next_drawn, _outcome(STATE_TOTAL[next_hand])
+                    finished[key] = finished.get(key, 0) + orders
+                else:
+                    earlier = next_drawing.get(next_drawn, (next_hand, 0))[1]
+                    next_drawing[next_drawn] = next_hand, earlier + orders
+        drawing = next_drawing
+    drawn = np.array([drawn for drawn, _ in finished], dtype=np.intp)
+    table = (drawn, drawn.sum(axis=1), np.array(list(finished.values()), dtype=float),
+             np.array([outcome for _, outcome in finished], dtype=np.intp))
+    _tables[state] = table
+    return table
+
+
+def _falling(counts, most):
+    # counts[..., k] = n (n - 1) ... (n - k + 1) for k up to `most`: the ways
+    # to draw k cards in order from n, which is 0 once k > n
+    import numpy as np
+    counts = np.asarray(counts, dtype=float)
+    result = np.ones(counts.shape + (most + 1,))
+    result[..., 1:] = np.cumprod(counts[..., None] - np.arange(most), axis=-1)
+    return result
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _distribution(state, composition, exact):
+    # With `exact`, each card the dealer draws is removed from the composition.
+    # Otherwise every draw uses the odds of `composition` as given.
+    counts = composition_counts(composition)
+    cards_left = sum(counts)
+    if STATE_DEALER_STANDS[state] or cards_left == 0:
+        return _final(STATE_TOTAL[state])
+
+    import numpy as np
+    drawn, draws, orders, outcomes = _table(state)
+    classes = np.arange(VALUE_CLASSES)
+    if exact:
+        ways = _falling(counts, drawn.max())[classes, drawn].prod(axis=1)
+        sequences = _falling(cards_left, draws.max())[draws]
+        # Rows drawing more cards than are left are impossible (0 ways)
+        chances = np.divide(orders * ways, sequences, out=np.zeros(len(orders)),
+                            where=sequences > 0)
+    else:
+        odds = np.array(counts, dtype=float) / cards_left
+        powers = odds[:, None] ** np.arange(drawn.max() + 1)
+        chances = orders * powers[classes, drawn].prod(axis=1)
+    result = np.bincount(outcomes, weights=chances, minlength=len(DEALER_OUTCOMES))
+    if exact and cards_left < draws.max():
+        # The rest is the shoe running dry before the dealer could stand
+        result[_outcome(STATE_TOTAL[state])] += max(0.0, 1.0 - result.sum())
+    return tuple(result.tolist())
+
+
+def dealer_distribution(hard, has_ace, composition):
+    # Final-total distribution for a dealer hand with this hard total (Aces as 1)
+    # that holds an Ace or not, still to draw from `composition`.
+    # Returns probabilities in DEALER_OUTCOMES order: 17, 18, 19, 20, 21, bust.
+    return _distribution(state_of(hard, has_ace), composition, True)
+
+
+def dealer_distribution_for_upcard(upcard, composition):
+    # Distribution when only the dealer's visible card is known: the hidden
+    # card is just another draw, so `composition` must still include it.
+    return _distribution(hand_state((upcard,)), composition, True)
+
+
+def fixed_odds_distribution(hard, has_ace, composition):
+    # Fast approximation of dealer_distribution: card odds stay those of
+    # `composition` for every draw (the dealer's own cards aren't removed).
+    return _distribution(state_of(hard, has_ace), composition, False)
+
+
+def cache_info():
+    return _distribution.cache_info()
+
+
+def clear_cache():
+    _distribution.cache_clear()
@@ -1,7 +1,93 @@
 import random
 
+from cards import CARD_VALUE, CARD_CLASS_UNIT, DECK_SIZE, new_deck
+from dealer_odds import dealer_distribution, dealer_distribution_for_upcard
+from hand_states import (EMPTY_STATE, NEXT_STATE, STATE_DEALER_STANDS, STATE_HARD,
+                         STATE_HAS_ACE, STATE_IS_BUST, STATE_IS_SOFT, STATE_TOTAL,
+                         hand_state)
+from shoe import Shoe, ShuffleBatches
+
+# Round outcomes, as returned by Game21.round_outcome()
+PLAYER_BUST = "player_bust"
+DEALER_BUST = "dealer_bust"
+PLAYER_WIN = "player_win"
+DEALER_WIN = "dealer_win"
+PUSH = "push"
+
+# Messages shown to the player for each outcome
+RESULT_MESSAGES = {
+    PLAYER_BUST: "Player busts. Dealer wins, get better luck!",
+    DEALER_BUST: "Dealer busts. Player wins, gambling always pays off!",
+    PLAYER_WIN: "Player wins",
+    DEALER_WIN: "Dealer wins",
+    PUSH: "Push (tie)",
+}
+
+class Hand:
+    # A hand of card codes plus its state in the hand state machine (see
+    # hand_states.py). Each append is one table lookup, and the total, soft
+    # and bust checks are lookups on the state, so nothing walks the cards.
+    def __init__(self, cards=()):
+        self.cards = []
+        self.state = EMPTY_STATE
+        for card in cards:
+            self.append(card)
+
+    def append(self, card):
+        self.cards.append(card)
+        self.state = NEXT_STATE[self.state * DECK_SIZE + card]
+
+    @property
+    def hard_total(self):
+        # Total with every Ace counted as 1
+        return STATE_HARD[self.state]
+
+    @property
+    def has_ace(self):
+        return STATE_HAS_ACE[self.state] == 1
+
+    def total(self):
+        # Best total: one Ace counts as 11 if it still fits under 21
+        return STATE_TOTAL[self.state]
+
+    def is_soft(self):
+        # True when an Ace is currently being counted as 11
+        return STATE_IS_SOFT[self.state] == 1
+
+    def is_bust(self):
+        return STATE_IS_BUST[self.state] == 1
+
+    def dealer_stands(self):
+        # True once a dealer holding this hand stops drawing (17 or more, or bust)
+        return STATE_DEALER_STANDS[self.state] == 1
+
+    # List-like access so the UI can keep indexing and iterating hands
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __getitem__(self, index):
+        return self.cards[index]
+
+    def __iter__(self):
+        return iter(self.cards)
+
+    def __repr__(self):
+        return f"Hand({self.cards!r})"
+
 class Game21:
-    def __init__(self):
+    def __init__(self, rng=None, decks=1, penetration=0.75, seed=None):
+        # Shuffles use this random generator (anything with a shuffle() method,
+        # e.g. random.Random(seed)); by default the global random module.
+        # With a seed, shuffles come from pre-generated batches instead (see
+        # shoe.ShuffleBatches) and every round can be replayed from the seed.
+        if rng is None and seed is not None:
+            rng = ShuffleBatches(seed)
+        self.rng = random if rng is None else rng
+        self.seed = self.rng.seed if isinstance(self.rng, ShuffleBatches) else None
+        # Cards are dealt from a shoe of `decks` decks that persists across rounds
+        # and is reshuffled once `penetration` of it has been dealt.
+        self.shoe = Shoe(decks, penetration, self.rng)
         # Start immediately with a fresh round
         self.new_round()
 
@@ -10,64 +96,46 @@ class Game21:
     def new_round(self):
         # Prepares for a new round
         # Suggested process:
-        # - Create and shuffle a new deck
-        # - Reset card pointer
+        # - Reshuffle the shoe if the cut card has been reached
         # - Empty both hands
         # - Reset whether the dealer's hidden card has been revealed
-        self.deck = self.create_deck()
-        random.shuffle(self.deck)
-
-        # Instead of removing cards from the deck,
-        # we keep an index of the "next card" to deal.
-        self.deck_position = 0
+        # Instead of removing cards from the deck, the shoe keeps an index
+        # of the "next card" to deal, and it carries over between rounds.
+        self.shoe.start_round()
 
         # Hands start empty; cards will be dealt after UI calls deal_initial_cards()
-        self.player_hand = []
-        self.dealer_hand = []
+        self.player_hand = Hand()
+        self.dealer_hand = Hand()
 
         # The first dealer card starts hidden until Stand is pressed
         self.dealer_hidden_revealed = False
 
     def deal_initial_cards(self):
         # Deal two cards each to player and dealer.
-        self.player_hand = [self.draw_card(), self.draw_card()]
-        self.dealer_hand = [self.draw_card(), self.draw_card()]
+        self.player_hand = Hand([self.draw_card(), self.draw_card()])
+        self.dealer_hand = Hand([self.draw_card(), self.draw_card()])
 
     # DECK AND CARD DRAWING
 
     def create_deck(self):
-        # Create a standard 52-card deck represented as text strings, e.g.:
-        # 'A♠', '10♥', 'K♦'.
-        # Ranks: A, 2–10, J, Q, K
-        # Suits: spades, hearts, diamonds, clubs (with unicode symbols)
-        ranks = ["A"] + [str(n) for n in range(2, 11)] + ["J", "Q", "K"]
-        suits = ["♠", "♥", "♦", "♣"]
-        return [f"{rank}{suit}" for rank in ranks for suit in suits]
+        # Create a standard 52-card deck of compact card codes (0-51).
+        # See cards.py for the encoding; the UI converts codes to text
+        # like 'A♠', '10♥', 'K♦' only when it needs to display them.
+        return new_deck()
 
     def draw_card(self):
-        # Return the next card in the shuffled deck.
-        card = self.deck[self.deck_position]
-        self.deck_position += 1
-        return card
+        # Return the next card in the shoe.
+        return self.shoe.draw()
 
     # HAND VALUES + ACE HANDLING
 
     def card_value(self, card):
-        # Convert a card string into its numeric value.
+        # Convert a card code into its numeric value (table lookup).
         # Rules:
         # - Number cards = their number (2–10)
         # - J, Q, K = 10
         # - A is normally 11, may later count as 1 if needed
-        rank = card[:-1]  # everything except the suit symbol
-
-        if rank in ["J", "Q", "K"]:
-            return 10
-
-        if rank == "A":
-            return 11  # Initially treat Ace as 11
-
-        # Otherwise it's a number from 2 to 10
-        return int(rank)
+        return CARD_VALUE[card]
 
     def hand_total(self, hand):
         # Calculates the best possible total for a hand.
@@ -76,21 +144,11 @@ class Game21:
         # Suggested Process:
         # 1. Count all Aces as 11 initially.
         # 2. If total > 21, subtract 10 for each Ace, so it effectively makes them = 1
-        total = 0
-        aces = 0
-        
-        for card in hand:
-            value = self.card_value(card)
-            total += value
-            if card[:-1] == "A":
-                aces += 1
-        
-        # If we bust and have aces, reduce them from 11 to 1
-        while total > 21 and aces > 0:
-            total -= 10
-            aces -= 1
-        
-        return total
+        # Hand objects already track their state; other collections of card
+        # codes are run through the same state machine.
+        if isinstance(hand, Hand):
+            return hand.total()
+        return STATE_TOTAL[hand_state(hand)]
 
     # Player actions
 
@@ -102,7 +160,7 @@ class Game21:
 
     def player_total(self):
         # Return the player's total.
-        return self.hand_total(self.player_hand)
+        return self.player_hand.total()
 
     # Dealer actions
 
@@ -113,17 +171,58 @@ class Game21:
 
     def dealer_total(self):
         # Return the dealer's total.
-        return self.hand_total(self.dealer_hand)
+        return self.dealer_hand.total()
+
+    def visible_dealer_total(self):
+        # Total of the dealer's visible card (dealer_hand[1]) while the first
+        # card is still hidden
+        return STATE_TOTAL[hand_state(self.dealer_hand[1:2])]
 
     def play_dealer_turn(self):
         # Dealer must hit until their total is 17 or more, then stand.
-        while self.dealer_total() < 17:
-            card = self.draw_card()
-            self.dealer_hand.append(card)
+        dealer_hand = self.dealer_hand
+        while not dealer_hand.dealer_stands():
+            dealer_hand.append(self.draw_card())
         return self.dealer_hand
 
+    def dealer_outcome_probabilities(self):
+        # Exact probabilities of the dealer finishing on 17, 18, 19, 20, 21 or bust
+        # (see dealer_odds.DEALER_OUTCOMES), from what the player can see.
+        # Before the reveal only dealer_hand[1] is known, so the hidden card is
+        # treated as one more unknown card in the shoe.
+        composition = self.unseen_composition()
+        if not self.dealer_hidden_revealed:
+            return dealer_distribution_for_upcard(self.dealer_hand[1], composition)
+        return dealer_distribution(self.dealer_hand.hard_total, self.dealer_hand.has_ace, composition)
+
+    def unseen_composition(self):
+        # Packed composition (see cards.py) of every card the player can't see:
+        # the undealt shoe plus the dealer's hidden card until it is revealed.
+        composition = self.shoe.composition
+        if not self.dealer_hidden_revealed and len(self.dealer_hand) > 0:
+            composition += CARD_CLASS_UNIT[self.dealer_hand[0]]
+        return composition
+
     # Winner determination
 
+    def round_outcome(self):
+        # Decide the outcome of the round as one of the outcome constants
+        # (PLAYER_BUST, DEALER_BUST, PLAYER_WIN, DEALER_WIN, PUSH).
+        if self.player_hand.is_bust():
+            return PLAYER_BUST
+        if self.dealer_hand.is_bust():
+            return DEALER_BUST
+
+        player_total = self.player_total()
+        dealer_total = self.dealer_total()
+        
+        if player_total > dealer_total:
+            return PLAYER_WIN
+        elif dealer_total > player_total:
+            return DEALER_WIN
+        else:
+            return PUSH
+
     def decide_winner(self):
         # Decide the outcome of the round.
         # Returns text messages:
@@ -132,17 +231,4 @@ class Game21:
         # - "Player wins!"
         # - "Dealer wins!"
         # - "Push (tie)."
-        player_total = self.player_total()
-        dealer_total = self.dealer_total()
-        
-        if player_total > 21:
-            return "Player busts. Dealer wins, get better luck!"
-        if dealer_total > 21:
-            return "Dealer busts. Player wins, gambling always pays off!"
-        
-        if player_total > dealer_total:
-            return "Player wins"
-        elif dealer_total > player_total:
-            return "Dealer wins"
-        else:
-            return "Push (tie)"
\ No newline at end of file
+        return RESULT_MESSAGES[self.round_outcome()]
\ No newline at end of file
@@ -0,0 +1,632 @@
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QLabel, QPushButton, 
+                             QVBoxLayout, QHBoxLayout, QWidget, QMessageBox, 
+                             QDialog, QDialogButtonBox, QMenuBar, QMenu, QSlider, QWidgetAction)
+from PyQt6.QtCore import Qt, QEvent
+from PyQt6.QtGui import QAction
+import os
+
+# this project should use a modular approach - try to keep UI logic and game logic separate
+from game_logic import Game21, PLAYER_BUST, DEALER_BUST, PLAYER_WIN, DEALER_WIN, PUSH
+from advisor import game_evs
+from card_display import CardDisplay, card_size_bucket
+from music_manager import music_manager
+from sound_effects import sound_effects
+from table_view import CardTable
+from preloader import finish_preloading
+from app_style import apply_app_stylesheet
+from animation_manager import IdleAnimationGuard, PulseAnimation, low_power, set_low_power
+
+# The game screen. main.py imports this module only after the welcome
+# screen has painted (see startup.py), so it stays off the startup path.
+
+# Sound effect played with the result dialog for each round outcome
+RESULT_SOUNDS = {
+    PLAYER_BUST: "lose",
+    DEALER_WIN: "lose",
+    DEALER_BUST: "win",
+    PLAYER_WIN: "win",
+    PUSH: "push",
+}
+
+# Draw the cards on a QGraphicsScene table instead of as labels (see
+# table_view.py); on when LUDO_TABLE_VIEW is set, and can be toggled
+TABLE_VIEW = bool(os.environ.get("LUDO_TABLE_VIEW"))
+
+# Deal every game from this seed (LUDO_SEED), so a session can be replayed
+# card for card while debugging
+SEED = int(os.environ["LUDO_SEED"]) if os.environ.get("LUDO_SEED") else None
+
+class MainWindow(QMainWindow):
+
+    def __init__(self, shell):
+        super().__init__()
+        # AppShell hosting this page (see app_shell.py)
+        self.shell = shell
+        self.setWindowTitle("LUDO")
+
+        # Size the shell takes while this page is shown (it also centers it)
+        self.setMinimumSize(600, 700)
+
+        self.game = Game21(seed=SEED)
+        
+        # Take over whatever the welcome screen's background preloading
+        # hasn't finished yet, so the first deal doesn't decode any cards
+        finish_preloading()
+        
+        # Deal/flip/result effects, loaded once for the whole app
+        self.sounds = sound_effects()
+        
+        # Initialize card display helper
+        self.card_display = CardDisplay(sounds=self.sounds)
+        
+        # Card labels on screen and what each one currently shows, per hand.
+        # Renders compare these against the game's hands and only touch changes.
+        self.dealer_card_labels = []
+        self.dealer_shown = []
+        self.player_card_labels = []
+        self.player_shown = []
+        # Cards follow the window size and the screen's device pixel ratio
+        self.update_card_size()
+
+        # The shared music (already playing if the welcome screen started it)
+        self.music = music_manager()
+        self.music.play()
+
+        self.initUI()
+        self.load_stylesheet()
+        self.sounds.set_volume(self.music.volume())
+
+    def initUI(self):
+        # Create menu bar
+        self.create_menu_bar()
+        
+        # Create central widget and main layout
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout()
+        central_widget.setLayout(main_layout)
+        
+        # Dealer Section
+        dealer_label = QLabel("Dealer:")
+        dealer_label.setObjectName("sectionLabel")
+        main_layout.addWidget(dealer_label)
+        
+        self.dealerCardsLayout = QHBoxLayout()
+        self.dealer_cards_widget = QWidget()
+        self.dealer_cards_widget.setLayout(self.dealerCardsLayout)
+        self.dealer_cards_widget.setMinimumHeight(180)  # Reserve space for cards
+        main_layout.addWidget(self.dealer_cards_widget)
+        
+        # Scene-based version of the same row, shown in table view instead
+        self.dealerTable = CardTable()
+        self.dealerTable.setMinimumHeight(180)
+        self.dealerTable.hide()
+        main_layout.addWidget(self.dealerTable)
+        
+        self.dealerTotalLabel = QLabel("Total: 0")
+        self.dealerTotalLabel.setObjectName("totalLabel")
+        main_layout.addWidget(self.dealerTotalLabel)
+        
+        main_layout.addSpacing(5)
+        
+        # Player Section
+        player_label = QLabel("Player:")
+        player_label.setObjectName("sectionLabel")
+        main_layout.addWidget(player_label)
+        
+        self.playerCardsLayout = QHBoxLayout()
+        self.player_cards_widget = QWidget()
+        self.player_cards_widget.setLayout(self.playerCardsLayout)
+        self.player_cards_widget.setMinimumHeight(180)  # Reserve space for cards
+        main_layout.addWidget(self.player_cards_widget)
+        
+        self.playerTable = CardTable()
+        self.playerTable.setMinimumHeight(180)
+        self.playerTable.hide()
+        main_layout.addWidget(self.playerTable)
+        
+        # Where each hand's cards currently go: the label row's layout, or
+        # the table's hand in table view
+        self.dealer_cards = self.dealerCardsLayout
+        self.player_cards = self.playerCardsLayout
+        self.set_table_view(TABLE_VIEW)
+        
+        player_total_layout = QHBoxLayout()
+        self.playerTotalLabel = QLabel("Total: 0")
+        self.playerTotalLabel.setObjectName("totalLabel")
+        player_total_layout.addWidget(self.playerTotalLabel)
+        
+        # Optional hit/stand hint, toggled from the Settings menu
+        self.playerHintLabel = QLabel("")
+        self.playerHintLabel.setObjectName("hintLabel")
+        self.playerHintLabel.setVisible(False)
+        player_total_layout.addWidget(self.playerHintLabel)
+        player_total_layout.addStretch()
+        main_layout.addLayout(player_total_layout)
+        
+        main_layout.addSpacing(5)
+        
+        # Feedback label
+        self.feedbackLabel = QLabel("Click 'New Round' to start!")
+        self.feedbackLabel.setObjectName("feedbackLabel")
+        self.feedbackLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        main_layout.addWidget(self.feedbackLabel)
+        
+        # Add pulsating animation to feedback label (paused while the window is idle)
+        self.feedback_animation = PulseAnimation(self.feedbackLabel, 0.8, 1.0)
+        self.feedback_animation.start()
+        self.animation_guard = IdleAnimationGuard(self, [self.feedback_animation])
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        
+        self.hitButton = QPushButton("HIT ME")
+        self.hitButton.setObjectName("actionButton")
+        self.hitButton.clicked.connect(self.on_hit)
+        button_layout.addWidget(self.hitButton)
+        
+        self.standButton = QPushButton("Stand :(")
+        self.standButton.setObjectName("actionButton")
+        self.standButton.clicked.connect(self.on_stand)
+        button_layout.addWidget(self.standButton)
+        
+        self.newRoundButton = QPushButton("New round!")
+        self.newRoundButton.setObjectName("newRoundButton")
+        self.newRoundButton.clicked.connect(self.on_new_round)
+        button_layout.addWidget(self.newRoundButton)
+        
+        main_layout.addLayout(button_layout)
+        
+        main_layout.addStretch()
+        
+        # Initially disable hit and stand buttons until a round starts
+        self.hitButton.setEnabled(False)
+        self.standButton.setEnabled(False)
+
+
+    # STYLESHEET
+    
+    def load_stylesheet(self):
+        # The stylesheet is read once and applied to the whole application,
+        # so this window doesn't need its own copy
+        apply_app_stylesheet()
+    
+    # MENU BAR
+    
+    def create_menu_bar(self):
+        menubar = self.menuBar()
+        
+        # Game menu
+        game_menu = menubar.addMenu("Game")
+        
+        main_menu_action = game_menu.addAction("Main Menu")
+        main_menu_action.triggered.connect(self.quit_to_main_menu)
+        
+        game_menu.addSeparator()
+        
+        quit_action = game_menu.addAction("Quit")
+        quit_action.setMenuRole(QAction.MenuRole.NoRole)
+        quit_action.triggered.connect(self.quit_game)
+        
+        # Settings menu
+        settings_menu = menubar.addMenu("Settings")
+        
+        # Volume control in settings menu
+        volume_widget = QWidget()
+        volume_widget.setObjectName("volumeWidget")
+        volume_layout = QHBoxLayout()
+        volume_layout.setContentsMargins(15, 8, 15, 8)
+        volume_layout.setSpacing(8)
+        
+        volume_label = QLabel("Volume:")
+        volume_label.setObjectName("volumeLabel")
+        volume_layout.addWidget(volume_label)
+        
+        self.volume_slider = QSlider(Qt.Orientation.Horizontal)
+        self.volume_slider.setObjectName("volumeSlider")
+        self.volume_slider.setMinimum(0)
+        self.volume_slider.setMaximum(100)
+        self.volume_slider.setValue(round(self.music.volume() * 100))
+        self.volume_slider.setFixedWidth(150)
+        self.volume_slider.valueChanged.connect(self.update_volume)
+        volume_layout.addWidget(self.volume_slider)
+        
+        self.volume_value_label = QLabel(f"{self.volume_slider.value()}%")
+        self.volume_value_label.setObjectName("volumeValueLabel")
+        volume_layout.addWidget(self.volume_value_label)
+        
+        volume_widget.setLayout(volume_layout)
+        
+        volume_action = QWidgetAction(self)
+        volume_action.setDefaultWidget(volume_widget)
+        settings_menu.addAction(volume_action)
+        
+        settings_menu.addSeparator()
+        
+        self.hint_action = settings_menu.addAction("Show hint")
+        self.hint_action.setCheckable(True)
+        self.hint_action.toggled.connect(self.toggle_hint)
+        
+        # Low power: replace pulsing animations with a static style
+        low_power_action = settings_menu.addAction("Low power mode")
+        low_power_action.setCheckable(True)
+        low_power_action.setChecked(low_power())
+        low_power_action.toggled.connect(set_low_power)
+        
+        table_view_action = settings_menu.addAction("Scene table view")
+        table_view_action.setCheckable(True)
+        table_view_action.setChecked(TABLE_VIEW)
+        table_view_action.toggled.connect(self.set_table_view)
+        
+        settings_menu.addSeparator()
+        
+        card_back_menu = settings_menu.addMenu("Back of card color")
+        
+        # Red card backs
+        red_submenu = card_back_menu.addMenu("Red")
+        for i in range(1, 6):
+            action = red_submenu.addAction(f"Red {i}")
+            action.triggered.connect(lambda checked, num=i: self.change_card_back(f"cardBack_red{num}.png"))
+        
+        # Blue card backs
+        blue_submenu = card_back_menu.addMenu("Blue")
+        for i in range(1, 6):
+            action = blue_submenu.addAction(f"Blue {i}")
+            action.triggered.connect(lambda checked, num=i: self.change_card_back(f"cardBack_blue{num}.png"))
+        
+        # Green card backs
+        green_submenu = card_back_menu.addMenu("Green")
+        for i in range(1, 6):
+            action = green_submenu.addAction(f"Green {i}")
+            action.triggered.connect(lambda checked, num=i: self.change_card_back(f"cardBack_green{num}.png"))
+        
+        # Help menu
+        help_menu = menubar.addMenu("Help")
+        
+        rules_action = help_menu.addAction("Rules")
+        rules_action.triggered.connect(self.show_rules)
+        
+        help_menu.addSeparator()
+        
+        about_action = help_menu.addAction("About")
+        about_action.setMenuRole(QAction.MenuRole.NoRole)
+        about_action.triggered.connect(self.show_about)
+
+    def update_volume(self, value):
+        #convert slider value (0-100) to volume (0.0-1.0)
+        volume = value / 100.0
+        self.music.set_volume(volume)
+        self.sounds.set_volume(volume)
+        #update the label
+        if hasattr(self, 'volume_value_label'):
+            self.volume_value_label.setText(f"{value}%")
+    
+    def toggle_hint(self, checked):
+        # Show or hide the hit/stand hint next to the player's total
+        self.playerHintLabel.setVisible(checked)
+        self.update_hint()
+    
+    def update_hint(self):
+        # Refresh the hint while the player still has a decision to make
+        if not self.hint_action.isChecked() or not self.hitButton.isEnabled():
+            self.playerHintLabel.setText("")
+            return
+        stand_ev, hit_ev = game_evs(self.game)
+        action = "Hit" if hit_ev > stand_ev else "Stand"
+        self.playerHintLabel.setText(f"Hint: {action} (hit {hit_ev:+.2f} / stand {stand_ev:+.2f})")
+    
+    def quit_game(self):
+        # Close the app shell this page lives in
+        self.window().close()
+    
+    def quit_to_main_menu(self):
+        #switch the shell back to the (reused) welcome page (the music keeps playing)
+        self.shell.show_welcome()
+    
+    def change_card_back(self, card_back_file):
+        #change the card back style and refresh dealer cards if hidden
+        self.card_display.set_card_back_style(card_back_file)
+        #refresh the display if there are hidden dealer cards
+        if hasattr(self.game, 'dealer_hand') and len(self.game.dealer_hand) > 0:
+            if not self.game.dealer_hidden_revealed:
+                self.update_dealer_cards(full=False)
+
+
+    # Button actions
+
+    def on_hit(self):
+        # Player takes a card
+        self.game.player_hit()
+        self.update_player_cards()
+        
+        player_total = self.game.player_total()
+        self.playerTotalLabel.setText(f"Total: {player_total}")
+
+        if self.game.player_hand.is_bust():
+            # Player busts - end the round
+            self.feedbackLabel.setText("Player busts!")
+            self.end_round()
+            result = self.game.decide_winner()
+            self.show_result_dialog(result)
+        else:
+            self.update_hint()
+
+    def on_stand(self):
+        # Player ends turn, dealer reveals their hidden card and plays
+        self.game.reveal_dealer_card()
+        
+        # Play dealer's turn
+        self.game.play_dealer_turn()
+        
+        # Update dealer cards once after dealer finishes playing
+        self.update_dealer_cards(full=True)
+        
+        dealer_total = self.game.dealer_total()
+        self.dealerTotalLabel.setText(f"Total: {dealer_total}")
+        
+        # Determine winner
+        result = self.game.decide_winner()
+        self.feedbackLabel.setText(result)
+        self.end_round()
+        self.show_result_dialog(result)
+
+    def on_new_round(self):
+        self.game.new_round()
+        self.game.deal_initial_cards()
+        self.new_round_setup()
+
+    # HELPER METHODS
+
+    def display_key(self, card):
+        # What a label shows: the card code, or the current back style for "??"
+        if card == "??":
+            return ("??", self.card_display.card_back_style)
+        return card
+
+    def sync_hand(self, layout, labels, shown, wanted, animate=True):
+        # Bring one hand's labels in line with `wanted`, touching only what changed:
+        # - labels past the end of the hand go back to the pool
+        # - a face-down card turning face-up is flipped in place
+        # - any other changed card (e.g. a new card back) is swapped in place
+        # - new cards are appended
+        # Repaints are held off until the end so the hand updates in one pass.
+        container = layout.parentWidget()
+        container.setUpdatesEnabled(False)
+        
+        while len(labels) > len(wanted):
+            label = labels.pop()
+            shown.pop()
+            layout.removeWidget(label)
+            self.card_display.release_label(label)
+        
+        for i, card in enumerate(wanted):
+            key = self.display_key(card)
+            if i < len(labels):
+                if shown[i] != key:
+                    if isinstance(shown[i], tuple) and card != "??" and animate:
+                        self.card_display.animate_card_flip(labels[i], card)
+                    else:
+                        self.card_display.set_card_image(labels[i], card)
+                    shown[i] = key
+            else:
+                labels.append(self.card_display.add_card(layout, card, animate=animate))
+                shown.append(key)
+        
+        container.setUpdatesEnabled(True)
+
+    def update_player_cards(self, animate=True):
+        self.sync_hand(self.player_cards, self.player_card_labels,
+                       self.player_shown, list(self.game.player_hand), animate)
+
+    def update_dealer_cards(self, full=False, animate=True):
+        #show dealer cards, hide the first card until revealed
+        hidden = not full and not self.game.dealer_hidden_revealed
+        wanted = ["??" if i == 0 and hidden else card
+                  for i, card in enumerate(self.game.dealer_hand)]
+        self.sync_hand(self.dealer_cards, self.dealer_card_labels,
+                       self.dealer_shown, wanted, animate)
+
+        #update dealer total label
+        if full or self.game.dealer_hidden_revealed:
+            dealer_total = self.game.dealer_total()
+            self.dealerTotalLabel.setText(f"Total: {dealer_total}")
+        else:
+            #only show the visible cards value
+            if len(self.game.dealer_hand) > 1:
+                visible_value = self.game.visible_dealer_total()
+                self.dealerTotalLabel.setText(f"Total: {visible_value} + ?")
+            else:
+                self.dealerTotalLabel.setText("Total: ?")
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update_card_size()
+
+    def event(self, event):
+        # Moved to a screen with another device pixel ratio
+        if event.type() == QEvent.Type.DevicePixelRatioChange:
+            self.update_card_size()
+        return super().event(event)
+
+    def update_card_size(self):
+        # Pick the card size bucket for the current window size and DPR.
+        # Shown cards are only re-rendered when that changes; each distinct
+        # card is then scaled once for the new size and cached.
+        bucket = card_size_bucket(self.width(), self.height())
+        if not self.card_display.set_card_size(bucket, self.devicePixelRatioF()):
+            return
+        for labels, shown in ((self.dealer_card_labels, self.dealer_shown),
+                              (self.player_card_labels, self.player_shown)):
+            for label, key in zip(labels, shown):
+                self.card_display.set_card_image(label, "??" if isinstance(key, tuple) else key)
+
+    def new_round_setup(self):
+        #new visual layout: last round's labels go back to the pool
+        self.clear_hands()
+        
+        #update labels
+        player_total = self.game.player_total()
+        self.playerTotalLabel.setText(f"Total: {player_total}")
+        
+        #display new cards for dealers and players
+        self.update_player_cards()
+        self.update_dealer_cards(full=False)
+        
+        # Enable buttons for Stand and Hit
+        self.hitButton.setEnabled(True)
+        self.standButton.setEnabled(True)
+        self.newRoundButton.setEnabled(False)
+        self.feedback_animation.stop()
+        self.feedbackLabel.setText("Your turn")
+        self.update_hint()
+
+    def clear_hands(self):
+        #last round's cards go back to the pool
+        self.card_display.clear_layout(self.player_cards)
+        self.card_display.clear_layout(self.dealer_cards)
+        self.dealer_card_labels = []
+        self.dealer_shown = []
+        self.player_card_labels = []
+        self.player_shown = []
+
+    def set_table_view(self, enabled):
+        # Switch the card rows between labels and the scene tables, and
+        # show the current hands on the new ones without animating them
+        self.clear_hands()
+        self.dealer_cards_widget.setVisible(not enabled)
+        self.player_cards_widget.setVisible(not enabled)
+        self.dealerTable.setVisible(enabled)
+        self.playerTable.setVisible(enabled)
+        if enabled:
+            self.dealer_cards = self.dealerTable.hand()
+            self.player_cards = self.playerTable.hand()
+        else:
+            self.dealer_cards = self.dealerCardsLayout
+            self.player_cards = self.playerCardsLayout
+        if hasattr(self.game, 'player_hand') and len(self.game.player_hand) > 0:
+            self.update_player_cards(animate=False)
+            self.update_dealer_cards(animate=False)
+
+    def end_round(self):
+        # Disable button actions after the round ends
+        self.hitButton.setEnabled(False)
+        self.standButton.setEnabled(False)
+        self.newRoundButton.setEnabled(True)
+        self.update_hint()
+    
+    def show_result_dialog(self, result):
+        # Dialog box for round result
+        self.sounds.play(RESULT_SOUNDS[self.game.round_outcome()])
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Round Result")
+        dialog.setMinimumSize(500, 250)
+        
+        layout = QVBoxLayout()
+        dialog.setLayout(layout)
+        
+        # Add spacing at top
+        layout.addStretch()
+        
+        # Result text label
+        result_label = QLabel(result)
+        result_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        result_label.setProperty("role", "result")
+        layout.addWidget(result_label)
+        
+        # Add spacing in middle
+        layout.addStretch()
+        
+        # Button centered
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        
+        ok_button = QPushButton("OK")
+        ok_button.setObjectName("resultButton")
+        ok_button.setMinimumSize(150, 50)
+        ok_button.clicked.connect(dialog.accept)
+
+        button_layout.addWidget(ok_button)        
+        button_layout.addStretch()
+        layout.addLayout(button_layout)
+        
+        # Add spacing at bottom
+        layout.addSpacing(20)
+        
+        dialog.exec()
+    
+    def show_rules(self):
+        # Show rules dialog
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Game Rules")
+        dialog.setFixedSize(600, 450)
+        
+        # Center the dialog
+        screen = QApplication.primaryScreen().geometry()
+        dialog_geometry = dialog.frameGeometry()
+        center_point = screen.center()
+        dialog_geometry.moveCenter(center_point)
+        dialog.move(dialog_geometry.topLeft())
+        
+        layout = QVBoxLayout()
+        dialog.setLayout(layout)
+        
+        rules_text = QLabel("""
+        <h2 style='font-size: 20px;'>Game of 21 (Blackjack) Rules:</h2>
+        <ul style='font-size: 16px; line-height: 1.6;'>
+        <li>The goal is to get as close to 21 as possible without going over.</li>
+        <li>Face cards (J, Q, K) are worth 10 points.</li>
+        <li>Aces are worth 11 points, or 1 point if 11 would cause a bust.</li>
+        <li>Number cards are worth their face value.</li>
+        <li>Click "Hit" to receive another card.</li>
+        <li>Click "Stand" to end your turn and let the dealer play.</li>
+        <li>The dealer must hit until they reach 17 or higher.</li>
+        <li>If you go over 21, you bust and lose.</li>
+        <li>The player closest to 21 without going over wins!</li>
+        </ul>
+        """)
+        rules_text.setWordWrap(True)
+        rules_text.setProperty("role", "rules")
+        layout.addWidget(rules_text)
+        
+        ok_button = QPushButton("OK")
+        ok_button.setObjectName("resultButton")
+        ok_button.setFixedSize(120, 45)
+        ok_button.clicked.connect(dialog.accept)
+        layout.addWidget(ok_button, alignment=Qt.AlignmentFlag.AlignCenter)
+        
+        dialog.exec()
+    
+    def show_about(self):
+        # Show about dialog
+        dialog = QDialog(self)
+        dialog.setWindowTitle("About")
+        dialog.setFixedSize(500, 300)
+        
+        # Center the dialog
+        screen = QApplication.primaryScreen().geometry()
+        dialog_geometry = dialog.frameGeometry()
+        center_point = screen.center()
+        dialog_geometry.moveCenter(center_point)
+        dialog.move(dialog_geometry.topLeft())
+        
+        layout = QVBoxLayout()
+        dialog.setLayout(layout)
+        
+        about_text = QLabel(
+            "<h2 style='font-size: 24px;'>Game of 21 (Blackjack)</h2>"
+            "<p style='font-size: 16px; margin-top: 10px;'>A classic card game built with PyQt6</p>"
+            "<p style='font-size: 16px; margin-top: 10px;'>Made by Nichita Chirtoaca and Antonio Madrid</p>"
+            "<p style='font-size: 16px;'>Try to beat the dealer!</p>"
+        )
+        about_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        about_text.setWordWrap(True)
+        about_text.setProperty("role", "about")
+        layout.addWidget(about_text)
+        
+        ok_button = QPushButton("OK")
+        ok_button.setObjectName("resultButton")
+        ok_button.setFixedSize(120, 45)
+        ok_button.clicked.connect(dialog.accept)
+        layout.addWidget(ok_button, alignment=Qt.AlignmentFlag.AlignCenter)
+        
+        dialog.exec()
@@ -0,0 +1,60 @@
+from cards import CARD_CLASS, CARD_HARD_VALUE, CARD_IS_ACE, DECK_SIZE, VALUE_CLASSES
+
+# Hand totals as a small finite-state machine shared by Game21's Hand, the
+# vectorized batch engine and the UI's "Total: X" labels.
+# A hand's state is (hard total, soft flag): its total with every Ace counted
+# as 1, and whether it holds an Ace (which then counts as 11 whenever that
+# doesn't bust, making the hand soft). Adding a card is one lookup in
+# NEXT_STATE, and everything the rules ask about a hand (best total, soft,
+# bust, whether the dealer stands) is one lookup per state.
+#
+# A state is the int hard * 2 + (1 if the hand holds an Ace). Hard totals
+# stop at MAX_HARD: the most a real hand reaches is 31 (hitting a hard 21
+# with a ten), since nobody draws again once bust.
+
+MAX_HARD = 31
+STATE_COUNT = (MAX_HARD + 1) * 2
+EMPTY_STATE = 0
+
+# The dealer hits below this total and stands on it or above
+DEALER_STANDS_ON = 17
+
+
+def state_of(hard, has_ace):
+    return min(hard, MAX_HARD) * 2 + has_ace
+
+
+# Lookup tables indexed by state
+# - STATE_HARD: total with every Ace as 1
+# - STATE_HAS_ACE: 1 if the hand holds an Ace
+# - STATE_TOTAL: best total, with one Ace as 11 whenever that doesn't bust
+# - STATE_IS_SOFT: 1 when an Ace is currently counted as 11
+# - STATE_IS_BUST: 1 when the best total is over 21
+# - STATE_DEALER_STANDS: 1 when a dealer with this hand stops drawing
+STATE_HARD = bytes(state // 2 for state in range(STATE_COUNT))
+STATE_HAS_ACE = bytes(state % 2 for state in range(STATE_COUNT))
+STATE_IS_SOFT = bytes(int(ace == 1 and hard <= 11) for hard, ace in zip(STATE_HARD, STATE_HAS_ACE))
+STATE_TOTAL = bytes(hard + 10 * soft for hard, soft in zip(STATE_HARD, STATE_IS_SOFT))
+STATE_IS_BUST = bytes(int(total > 21) for total in STATE_TOTAL)
+STATE_DEALER_STANDS = bytes(int(total >= DEALER_STANDS_ON) for total in STATE_TOTAL)
+
+# Transition table: the state after adding card code `card` to a hand in
+# `state` is NEXT_STATE[state * DECK_SIZE + card]
+NEXT_STATE = bytes(state_of(hard + CARD_HARD_VALUE[card], ace | CARD_IS_ACE[card])
+                   for hard, ace in zip(STATE_HARD, STATE_HAS_ACE)
+                   for card in range(DECK_SIZE))
+
+# The same transitions by value class (see cards.py) instead of card code, for
+# the engines that draw from a shoe composition:
+# NEXT_STATE_BY_CLASS[state * VALUE_CLASSES + cls]
+CLASS_CARD = bytes(CARD_CLASS.index(cls) for cls in range(VALUE_CLASSES))
+NEXT_STATE_BY_CLASS = bytes(NEXT_STATE[state * DECK_SIZE + card]
+                            for state in range(STATE_COUNT)
+                            for card in CLASS_CARD)
+
+
+def hand_state(cards, state=EMPTY_STATE):
+    # State of a hand holding `cards`, starting from `state`
+    for card in cards:
+        state = NEXT_STATE[state * DECK_SIZE + card]
+    return state
@@ -2,8 +2,17 @@ from PyQt6.QtCore import QUrl
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 import os
 
+import perf
+
+# Background music volume (0.0 to 1.0) until the player moves the slider
+DEFAULT_VOLUME = 0.3
+
 class MusicManager:
+    # The app's one music pipeline (player + output + MP3 decoder).
+    # Windows get it through music_manager() instead of creating their own,
+    # so opening more windows never adds another decoder.
     def __init__(self):
+        perf.count("audio.music_players_created")
         self.audio_output = QAudioOutput()
         self.music_player = QMediaPlayer()
         self.music_player.setAudioOutput(self.audio_output)
@@ -16,11 +25,19 @@ class MusicManager:
         self.music_player.setLoops(QMediaPlayer.Loops.Infinite)
         
         # Set volume (0.0 to 1.0)
-        self.audio_output.setVolume(0.5)
+        self.audio_output.setVolume(DEFAULT_VOLUME)
     
     def play(self):
-        #Start playing the music
-        self.music_player.play()
+        #Start playing the music (does nothing if it already is)
+        if self.music_player.playbackState() != QMediaPlayer.PlaybackState.PlayingState:
+            self.music_player.play()
+    
+    def volume(self):
+        # Current volume, 0.0 to 1.0
+        return self.audio_output.volume()
+    
+    def set_volume(self, volume):
+        self.audio_output.setVolume(volume)
     
     def get_player(self):
         #Return the music player instance
@@ -29,3 +46,14 @@ class MusicManager:
     def get_audio_output(self):
         # Return the audio output instance
         return self.audio_output
+
+
+_music_manager = None
+
+
+def music_manager():
+    # The process-wide music manager, created on first use (it needs a QApplication)
+    global _music_manager
+    if _music_manager is None:
+        _music_manager = MusicManager()
+    return _music_manager
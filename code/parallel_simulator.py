@@ -0,0 +1,96 @@
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Multi-process runner: splits a simulation job across worker processes.
+# Every worker gets its own generator seeded from the master seed, so a run
+# is bit-for-bit reproducible for a given (master seed, worker count).
+from game_logic import Game21
+from simulator import SimulationResult, parse_policy, simulate
+
+
+def worker_seeds(master_seed, workers):
+    # Derive one independent 128-bit seed per worker from the master seed
+    seeder = random.Random(master_seed)
+    return [seeder.getrandbits(128) for _ in range(workers)]
+
+
+def split_rounds(rounds, workers):
+    # Spread rounds as evenly as possible; earlier workers take the remainder
+    base, extra = divmod(rounds, workers)
+    return [base + (1 if i < extra else 0) for i in range(workers)]
+
+
+def run_shard(rounds, policy, seed, engine):
+    # Runs inside a worker process. Policies must be picklable
+    # (ints, "basic", StandOnPolicy, BasicStrategyPolicy or module-level functions).
+    if engine == "batch":
+        from batch_simulator import simulate_batch
+        return simulate_batch(rounds, policy, seed=seed)
+    return simulate(rounds, policy, game=Game21(seed=seed))
+
+
+def simulate_parallel(rounds, policy=17, master_seed=0, workers=None, engine="scalar"):
+    # Run `rounds` rounds across `workers` processes (default: all cores)
+    # and merge the partial results. The merged result's elapsed time is
+    # the wall-clock time of the whole job.
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    shards = split_rounds(rounds, workers)
+    seeds = worker_seeds(master_seed, workers)
+
+    result = SimulationResult()
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_shard, shard, policy, seed, engine)
+                   for shard, seed in zip(shards, seeds)]
+        # Merge in worker order so the result never depends on completion order
+        for future in futures:
+            result.merge(future.result())
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def measure_scaling(rounds, policy=17, master_seed=0, worker_counts=None, engine="scalar"):
+    # Time the same job at several worker counts.
+    # Returns a list of (workers, result, speedup, efficiency) where speedup is
+    # relative to one worker and efficiency is speedup / workers.
+    if worker_counts is None:
+        cores = os.cpu_count() or 1
+        worker_counts = sorted({1, 2, cores} & set(range(1, cores + 1)))
+
+    rows = []
+    baseline = None
+    for workers in worker_counts:
+        result = simulate_parallel(rounds, policy, master_seed, workers, engine)
+        if baseline is None:
+            baseline = result.elapsed
+        speedup = baseline / result.elapsed if result.elapsed > 0 else 0.0
+        rows.append((workers, result, speedup, speedup / workers))
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Parallel Game of 21 simulation.")
+    parser.add_argument("--rounds", type=int, default=1000000)
+    parser.add_argument("--policy", type=parse_policy, default=17,
+                        help="stand-on total (e.g. 17) or 'basic'")
+    parser.add_argument("--seed", type=int, default=0, help="master seed")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--engine", choices=["scalar", "batch"], default="scalar")
+    parser.add_argument("--scaling", action="store_true",
+                        help="report speedup and efficiency across worker counts")
+    args = parser.parse_args()
+
+    if args.scaling:
+        for workers, result, speedup, efficiency in measure_scaling(
+                args.rounds, args.policy, args.seed, engine=args.engine):
+            print(f"{workers:>3} workers: {result.elapsed:.2f}s, "
+                  f"{result.rounds_per_second:,.0f} rounds/sec, "
+                  f"speedup {speedup:.2f}x, efficiency {efficiency:.0%}")
+    else:
+        result = simulate_parallel(args.rounds, args.policy, args.seed, args.workers, args.engine)
+        print(result.summary())
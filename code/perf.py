@@ -0,0 +1,55 @@
+import atexit
+import os
+import time
+
+# Lightweight performance counters and timers shared by the UI modules.
+# Recording is always on and costs a dict update; run with LUDO_PERF=1 to
+# print a report when the process exits.
+
+counters = {}
+timings = {}
+
+
+def count(name, amount=1):
+    counters[name] = counters.get(name, 0) + amount
+
+
+def record(name, seconds):
+    # Keep (calls, total seconds, worst seconds) per timer
+    calls, total, worst = timings.get(name, (0, 0.0, 0.0))
+    timings[name] = (calls + 1, total + seconds, max(worst, seconds))
+
+
+class timed:
+    # Context manager: `with perf.timed("name"): ...` records the block's duration
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self.start
+        record(self.name, self.elapsed)
+        return False
+
+
+def reset():
+    counters.clear()
+    timings.clear()
+
+
+def report():
+    lines = []
+    for name in sorted(counters):
+        lines.append(f"{name}: {counters[name]}")
+    for name in sorted(timings):
+        calls, total, worst = timings[name]
+        lines.append(f"{name}: {calls} calls, {total * 1000:.2f} ms total, "
+                     f"{total / calls * 1000:.3f} ms avg, {worst * 1000:.3f} ms worst")
+    return "\n".join(lines)
+
+
+if os.environ.get("LUDO_PERF"):
+    atexit.register(lambda: print(report()))
@@ -0,0 +1,209 @@
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QObject, QRect, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QFontDatabase, QGuiApplication, QImage
+import os
+import time
+
+import perf
+from app_style import read_stylesheet
+from card_atlas import ATLAS_IMAGE, CARDS_DIR, read_atlas_index
+from card_disk_cache import read_cache, write_cache
+from card_display import DEFAULT_BUCKET, DEFAULT_CARD_BACK, pixmap_cache
+from cards import CARD_IMAGE
+
+# Background asset preloading.
+# While the welcome screen is shown, AssetPreloader prepares what the game
+# screen needs on QThreadPool workers: card images are decoded and scaled as
+# QImages, the stylesheet is read and font files are loaded. Each result is
+# handed back to the GUI thread, which only does the cheap part (QPixmap
+# conversion into the shared pixmap_cache, font registration), so the first
+# deal finds every card already warm.
+# Card images come from the on-disk cache (see card_disk_cache.py) when it is
+# up to date, with no decoding or scaling at all. Otherwise they are prepared
+# from the atlas and the cache file is rewritten on a worker afterwards.
+
+# Fonts registered so far: path -> family name (None if it couldn't be loaded)
+_font_families = {}
+# Preloaders that haven't finished yet
+_running = []
+
+
+def register_font(path, data=None):
+    # Register a font file once (GUI thread); returns its family name or None.
+    # `data` is the file's bytes if they were already read.
+    if path not in _font_families:
+        if data is None:
+            font_id = QFontDatabase.addApplicationFont(path)
+        else:
+            font_id = QFontDatabase.addApplicationFontFromData(data)
+        families = QFontDatabase.applicationFontFamilies(font_id)
+        _font_families[path] = families[0] if families else None
+    return _font_families[path]
+
+
+def _read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _decode_atlas():
+    # Whole atlas image plus its index, or None if there is no usable atlas
+    index = read_atlas_index()
+    if index is None:
+        return None
+    image = QImage(ATLAS_IMAGE)
+    perf.count("card_images.file_reads")
+    if image.isNull():
+        return None
+    return image, index
+
+
+def _decode_file(filename):
+    perf.count("card_images.file_reads")
+    return QImage(os.path.join(CARDS_DIR, filename))
+
+
+def _scaled_or_none(cache, image, bucket, dpr):
+    return None if image.isNull() else cache.scaled(image, bucket, dpr)
+
+
+class AssetPreloader(QObject):
+    # progress(done, total) after each asset; loaded(name) with the card
+    # image filename, font path or "stylesheet"; finished() once at the end
+    progress = pyqtSignal(int, int)
+    loaded = pyqtSignal(str)
+    finished = pyqtSignal()
+
+    # Worker results; emitted from pool threads and delivered on the GUI thread
+    _result = pyqtSignal(str, str, object)
+
+    def __init__(self, card_back_styles=(DEFAULT_CARD_BACK,), fonts=(), cache=pixmap_cache,
+                 bucket=DEFAULT_BUCKET, dpr=None, pool=None, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.pool = pool or QThreadPool.globalInstance()
+        # Cards are prepared for the default window size on the primary screen
+        self.bucket = bucket
+        self.dpr = dpr if dpr is not None else QGuiApplication.primaryScreen().devicePixelRatio()
+        # Only what isn't warm yet
+        self.images = [name for name in list(CARD_IMAGE) + list(card_back_styles)
+                       if not cache.contains(name, bucket, self.dpr)]
+        self.fonts = [path for path in fonts if path not in _font_families]
+        self.total = len(self.images) + len(self.fonts) + 1
+        self.done = 0
+        self.started = None
+        # Images scaled by the workers, written to the disk cache at the end
+        self.scaled = {}
+        self._result.connect(self._on_result)
+
+    def start(self):
+        self.started = time.perf_counter()
+        _running.append(self)
+        # Don't let the app exit while workers are still running Python code
+        QCoreApplication.instance().aboutToQuit.connect(self.pool.waitForDone)
+        self._submit("stylesheet", "stylesheet", read_stylesheet)
+        for path in self.fonts:
+            self._submit("font", path, lambda path=path: _read_bytes(path))
+        if self.images:
+            if self.cache.use_disk_cache:
+                self._submit("disk", "disk", lambda: read_cache(self.bucket, self.dpr))
+            else:
+                self._submit("atlas", "atlas", _decode_atlas)
+
+    def is_finished(self):
+        return self.done >= self.total
+
+    def finish_now(self):
+        # Block until everything is loaded, handling results as they come in.
+        # For when the game screen is opened before preloading is done.
+        # Results arrive as queued signals: wait for the workers, then deliver
+        # their results (user input excluded). Handling the disk/atlas result
+        # submits the per-card work, hence the loop.
+        while not self.is_finished():
+            self.pool.waitForDone()
+            QCoreApplication.processEvents(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
+        # The last workers may still be returning after sending their result
+        self.pool.waitForDone()
+
+    def _submit(self, kind, name, work):
+        def run():
+            try:
+                result = work()
+            except Exception as e:  # Reported on the GUI thread, the asset loads lazily instead
+                result = e
+            self._result.emit(kind, name, result)
+        self.pool.start(run)
+
+    def _on_result(self, kind, name, result):
+        if isinstance(result, Exception):
+            print(f"Warning: could not preload {name}: {result}")
+            result = None
+
+        if kind == "disk":
+            self.cache.add_disk_images(result, self.bucket, self.dpr)
+            images = [name for name in self.images
+                      if not self.cache.contains(name, self.bucket, self.dpr)]
+            for filename in self.images:
+                if filename not in images:
+                    self._finish_one(filename)
+            self.images = images
+            if images:
+                self._submit("atlas", "atlas", _decode_atlas)
+            return
+
+        if kind == "atlas":
+            # Cut and scale each card image out of the atlas in parallel
+            # (or decode the separate files if there is no atlas)
+            for filename in self.images:
+                rect = result[1].get(filename) if result else None
+                if rect is not None:
+                    image = result[0]
+                    work = lambda image=image, rect=rect: _scaled_or_none(
+                        self.cache, image.copy(QRect(*rect)), self.bucket, self.dpr)
+                else:
+                    work = lambda filename=filename: _scaled_or_none(
+                        self.cache, _decode_file(filename), self.bucket, self.dpr)
+                self._submit("image", filename, work)
+            return
+
+        if kind == "image":
+            if result is not None and not self.cache.contains(name, self.bucket, self.dpr):
+                self.cache.put(name, result, self.bucket, self.dpr)
+                self.scaled[name] = result
+        elif kind == "font":
+            if result is not None:
+                register_font(name, result)
+        self._finish_one(name)
+
+    def _finish_one(self, name):
+        self.done += 1
+        self.loaded.emit(name)
+        self.progress.emit(self.done, self.total)
+        if self.is_finished():
+            elapsed = time.perf_counter() - self.started
+            perf.record("preload.total", elapsed)
+            if os.environ.get("LUDO_PERF"):
+                print(f"preload: {self.total} assets in {elapsed * 1000:.1f} ms")
+            _running.remove(self)
+            self._save_disk_cache()
+            self.finished.emit()
+
+    def _save_disk_cache(self):
+        # Rewrite the bucket's cache file if anything had to be decoded
+        if not self.scaled or not self.cache.use_disk_cache:
+            return
+        images = self.cache.disk_cache_images(self.bucket, self.dpr)
+        self.cache.disk_cache_saved(self.bucket, self.dpr)
+
+        def save():
+            try:
+                write_cache(self.bucket, self.dpr, images)
+            except OSError as e:
+                print(f"Warning: could not write card cache: {e}")
+        self.pool.start(save)
+
+
+def finish_preloading():
+    # Complete any preloading still running, so its assets are used rather
+    # than decoded a second time on the GUI thread
+    for preloader in list(_running):
+        preloader.finish_now()
@@ -0,0 +1,130 @@
+import random
+
+from cards import (CARD_CLASS_UNIT, COMPOSITION_MASK, DECK_SIZE, composition_of,
+                   new_deck)
+
+class Shoe:
+    # A multi-deck shoe that persists across rounds.
+    # All cards live in one preallocated buffer and are dealt by moving an index
+    # through it. The shoe is only reshuffled at the start of a round once the
+    # cut card (penetration, as a fraction of the shoe) has been passed.
+    # penetration=0 reshuffles before every round, like a fresh deck.
+    # `composition` is the packed count of undealt cards per value class
+    # (see cards.py), kept up to date on every draw.
+    def __init__(self, decks=1, penetration=0.75, rng=None):
+        if decks < 1:
+            raise ValueError("A shoe needs at least one deck")
+        if 16 * decks > COMPOSITION_MASK:
+            # 16 ten-valued cards per deck must fit in one packed composition field
+            raise ValueError("Too many decks for one shoe")
+        if not 0 <= penetration <= 1:
+            raise ValueError("Penetration must be between 0 and 1")
+
+        self.rng = random if rng is None else rng
+        self.decks = decks
+        self.size = DECK_SIZE * decks
+        self.cut_card = int(self.size * penetration)
+
+        # The buffer always holds every card of the shoe in dealing order
+        self.cards = new_deck() * decks
+        self.full_composition = composition_of(self.cards)
+        self.composition = self.full_composition
+        self.position = 0
+        # Where the current round started dealing from
+        self.round_start = 0
+        self.shuffle()
+
+    def shuffle(self):
+        # Gather all cards back and shuffle the whole shoe in place
+        self.rng.shuffle(self.cards)
+        self.position = 0
+        self.round_start = 0
+        self.composition = self.full_composition
+
+    def start_round(self):
+        # Called at the start of every round: reshuffle once past the cut card
+        if self.position >= self.cut_card:
+            self.shuffle()
+        self.round_start = self.position
+
+    def cards_left(self):
+        return self.size - self.position
+
+    def draw(self):
+        # Deal the next card. If the shoe runs out mid-round, the cards already
+        # on the table stay put and everything else is reshuffled behind them.
+        if self.position >= self.size:
+            self.reshuffle_discards()
+        card = self.cards[self.position]
+        self.position += 1
+        self.composition -= CARD_CLASS_UNIT[card]
+        return card
+
+    def reshuffle_discards(self):
+        in_play = self.cards[self.round_start:self.position]
+        discards = self.cards[:self.round_start]
+        self.rng.shuffle(discards)
+        self.cards[:len(in_play)] = in_play
+        self.cards[len(in_play):] = discards
+        self.round_start = 0
+        self.position = len(in_play)
+        self.composition = composition_of(discards)
+
+
+# PRE-GENERATED SHUFFLES
+# Shuffling a list one element at a time in Python is the main per-round cost
+# of the scalar engine. ShuffleBatches generates many permutations in one NumPy
+# call and hands them out one by one, so a Shoe reshuffle is a single list
+# gather. It has the same shuffle() method as random.Random, so it can be
+# passed as a Shoe's or Game21's rng; Game21(seed=...) uses one.
+# Only the full-shoe shuffle is batched: the mid-round reshuffles of the
+# discards have a different length every time, so they are drawn one at a
+# time instead of keeping a batch per length.
+# NumPy is only imported when shuffles are generated, so the GUI doesn't pay
+# for it unless it asks for a seed.
+
+SHUFFLE_BATCH_SIZE = 1024
+
+
+def permutations(generator, count, size):
+    # 2-D index array: `count` independent permutations of range(size), one
+    # per row. `generator` is a numpy.random.Generator.
+    import numpy as np
+    order = np.tile(np.arange(size, dtype=np.uint16), (count, 1))
+    return generator.permuted(order, axis=1)
+
+
+class ShuffleBatches:
+    # Reproducible shuffles drawn from pre-generated permutations.
+    # The same seed and batch size always give the same sequence of shuffles;
+    # with seed=None a fresh one is picked, and kept in `seed` so the run can
+    # be replayed.
+    # Batches are kept for one list length only: the first one shuffled, which
+    # for a Shoe is the whole shoe (it shuffles itself when created).
+    def __init__(self, seed=None, batch_size=SHUFFLE_BATCH_SIZE):
+        import numpy as np
+        sequence = np.random.SeedSequence(seed)
+        self.seed = sequence.entropy
+        self.generator = np.random.default_rng(sequence)
+        self.batch_size = batch_size
+        # The batched list length, and its permutations not handed out yet
+        self.batch_length = None
+        self._batch = []
+
+    def permutation(self, size):
+        # Next permutation of range(size), as a list
+        if self.batch_length is None:
+            self.batch_length = size
+        if size != self.batch_length:
+            return self.generator.permutation(size).tolist()
+        if not self._batch:
+            self._batch = permutations(self.generator, self.batch_size, size).tolist()
+            self._batch.reverse()  # Hand rows out in order by popping from the end
+        return self._batch.pop()
+
+    def shuffle(self, items):
+        # Reorder a list (or array) in place, like random.shuffle
+        order = self.permutation(len(items))
+        shuffled = items[:0]
+        shuffled.extend([items[i] for i in order])
+        items[:] = shuffled
@@ -0,0 +1,188 @@
+import argparse
+import time
+
+# Headless round simulator: drives Game21 with no Qt involved, so the
+# rules can be exercised at machine speed instead of through MainWindow.
+from cards import CARD_VALUE
+from game_logic import (Game21, PLAYER_BUST, DEALER_BUST, PLAYER_WIN,
+                        DEALER_WIN, PUSH)
+
+OUTCOMES = (PLAYER_BUST, DEALER_BUST, PLAYER_WIN, DEALER_WIN, PUSH)
+
+# PLAYER POLICIES
+# A policy is any callable taking the Game21 instance and returning
+# True to hit or False to stand.
+
+class StandOnPolicy:
+    # Keep hitting until the player's total reaches the threshold, then stand
+    def __init__(self, threshold=17):
+        self.threshold = threshold
+
+    def __call__(self, game):
+        return game.player_total() < self.threshold
+
+    def __repr__(self):
+        return f"StandOnPolicy({self.threshold})"
+
+
+# Hit/stand basic strategy for this game's rules (no doubling or splitting).
+# Each row is a player total; each column is the dealer's visible card,
+# from 2 through 10 and then Ace. Totals below a table stand for "hit",
+# totals above it stand for "stand".
+BASIC_HARD = {
+    12: "HHSSSHHHHH",
+    13: "SSSSSHHHHH",
+    14: "SSSSSHHHHH",
+    15: "SSSSSHHHHH",
+    16: "SSSSSHHHHH",
+}
+BASIC_SOFT = {
+    18: "SSSSSSSHHH",
+}
+
+
+class BasicStrategyPolicy:
+    # Look up hit/stand in a strategy table keyed by player total,
+    # soft flag and the dealer's visible card
+    def __init__(self, hard=None, soft=None):
+        self.hard = BASIC_HARD if hard is None else hard
+        self.soft = BASIC_SOFT if soft is None else soft
+
+    def __call__(self, game):
+        table = self.soft if game.player_hand.is_soft() else self.hard
+        total = game.player_total()
+        if total < min(table):
+            return True
+        if total > max(table):
+            return False
+        # The UI shows dealer_hand[1] while the first card stays hidden
+        upcard = CARD_VALUE[game.dealer_hand[1]]
+        return table[total][upcard - 2] == "H"
+
+    def __repr__(self):
+        return "BasicStrategyPolicy()"
+
+
+def make_policy(policy):
+    # Accept an int (stand-on-N), the names "basic", "optimal" and "exact",
+    # or any callable. "optimal" plays the advisor's default fixed-odds
+    # approximation; "exact" opts into its exact engine, at ~15 ms a round.
+    if isinstance(policy, int):
+        return StandOnPolicy(policy)
+    if policy == "basic":
+        return BasicStrategyPolicy()
+    if policy in ("optimal", "exact"):
+        from advisor import OptimalPolicy
+        return OptimalPolicy(exact=policy == "exact")
+    if callable(policy):
+        return policy
+    raise ValueError(f"Unknown policy: {policy!r}")
+
+
+# RESULTS
+
+class SimulationResult:
+    # Aggregate outcome counts plus timing for a batch of rounds
+    def __init__(self):
+        self.counts = dict.fromkeys(OUTCOMES, 0)
+        self.elapsed = 0.0
+
+    @property
+    def rounds(self):
+        return sum(self.counts.values())
+
+    @property
+    def wins(self):
+        return self.counts[PLAYER_WIN] + self.counts[DEALER_BUST]
+
+    @property
+    def losses(self):
+        return self.counts[DEALER_WIN] + self.counts[PLAYER_BUST]
+
+    @property
+    def pushes(self):
+        return self.counts[PUSH]
+
+    @property
+    def player_busts(self):
+        return self.counts[PLAYER_BUST]
+
+    @property
+    def dealer_busts(self):
+        return self.counts[DEALER_BUST]
+
+    @property
+    def rounds_per_second(self):
+        if self.elapsed <= 0:
+            return 0.0
+        return self.rounds / self.elapsed
+
+    def merge(self, other):
+        # Fold another result into this one (counts add, time adds)
+        for outcome, count in other.counts.items():
+            self.counts[outcome] += count
+        self.elapsed += other.elapsed
+        return self
+
+    def summary(self):
+        rounds = self.rounds or 1
+        return (
+            f"{self.rounds} rounds in {self.elapsed:.2f}s "
+            f"({self.rounds_per_second:,.0f} rounds/sec)\n"
+            f"  wins:   {self.wins} ({self.wins / rounds:.2%})\n"
+            f"  losses: {self.losses} ({self.losses / rounds:.2%})\n"
+            f"  pushes: {self.pushes} ({self.pushes / rounds:.2%})\n"
+            f"  player busts: {self.player_busts}, dealer busts: {self.dealer_busts}"
+        )
+
+
+# SIMULATION
+
+def play_round(game, policy):
+    # Play one full round with the same flow as MainWindow:
+    # deal, let the policy hit/stand, then the dealer plays unless the player bust.
+    game.new_round()
+    game.deal_initial_cards()
+
+    while policy(game):
+        game.player_hit()
+        if game.player_hand.is_bust():
+            return PLAYER_BUST
+
+    game.reveal_dealer_card()
+    game.play_dealer_turn()
+    return game.round_outcome()
+
+
+def simulate(rounds, policy=17, game=None):
+    # Play `rounds` rounds and return a SimulationResult
+    policy = make_policy(policy)
+    if game is None:
+        game = Game21()
+
+    result = SimulationResult()
+    counts = result.counts
+    start = time.perf_counter()
+    for _ in range(rounds):
+        counts[play_round(game, policy)] += 1
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def parse_policy(text):
+    # Command line policies: a number (stand-on-N), "basic", "optimal" or "exact"
+    return int(text) if text.isdigit() else text
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Simulate rounds of Game of 21 without the UI.")
+    parser.add_argument("--rounds", type=int, default=100000)
+    parser.add_argument("--policy", type=parse_policy, default=17,
+                        help="stand-on total (e.g. 17), 'basic', 'optimal' or 'exact'")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="deal from pre-generated shuffles with this seed")
+    args = parser.parse_args()
+
+    game = None if args.seed is None else Game21(seed=args.seed)
+    result = simulate(args.rounds, args.policy, game=game)
+    print(result.summary())
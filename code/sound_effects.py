@@ -0,0 +1,138 @@
+from PyQt6.QtCore import QObject, QUrl
+import math
+import os
+import random
+import struct
+import time
+import wave
+
+import perf
+
+# Short sound effects for dealing, flipping and round results.
+# Each effect is a small 16-bit PCM WAV, so there is nothing to decode while
+# playing. SoundEffects loads every effect once, into a fixed pool of
+# QSoundEffect voices per effect; play() only picks a free voice and starts it,
+# so quick repeated deals overlap instead of waiting for (or creating) another
+# player. Two timings are recorded through perf:
+#   sound_effects.play     - GUI thread time spent in play()
+#   sound_effects.latency  - from play() until the voice reports it's playing
+#
+# The WAVs are generated; rebuild them after changing synthesize():
+#     python tools.py build-sounds
+# Measure playback latency over a burst of deals:
+#     python tools.py bench-sounds
+
+SOUNDS_DIR = os.path.join(os.path.dirname(__file__), "assets", "sounds")
+EFFECTS = ("deal", "flip", "win", "lose", "push")
+SAMPLE_RATE = 22050
+# Voices per effect: how many copies of one effect can play at once
+VOICES_PER_EFFECT = 4
+
+
+def effect_path(name):
+    return os.path.join(SOUNDS_DIR, f"{name}.wav")
+
+
+def _tone(frequency, seconds, decay):
+    return [math.sin(2 * math.pi * frequency * i / SAMPLE_RATE) * math.exp(-decay * i / SAMPLE_RATE)
+            for i in range(int(seconds * SAMPLE_RATE))]
+
+
+def _noise(seconds, decay, smoothing, seed):
+    # Decaying noise, low-passed by a running average (higher smoothing = duller)
+    rng = random.Random(seed)
+    samples = []
+    level = 0.0
+    for i in range(int(seconds * SAMPLE_RATE)):
+        level += (rng.uniform(-1.0, 1.0) - level) / smoothing
+        samples.append(level * math.exp(-decay * i / SAMPLE_RATE))
+    return samples
+
+
+def synthesize(name):
+    # Samples (-1.0 to 1.0) for one effect
+    if name == "deal":
+        return _noise(0.08, 45, 3, seed=1)
+    if name == "flip":
+        click = _noise(0.03, 150, 1.5, seed=2)
+        thump = _tone(180, 0.03, 120)
+        return [a + 0.5 * b for a, b in zip(click, thump)]
+    notes = {"win": (523.25, 659.25, 783.99), "lose": (392.00, 311.13), "push": (440.00,)}[name]
+    samples = []
+    for frequency in notes:
+        samples += _tone(frequency, 0.12, 18)
+    return samples
+
+
+def build_sounds():
+    # Write every effect to SOUNDS_DIR as mono 16-bit WAV
+    os.makedirs(SOUNDS_DIR, exist_ok=True)
+    for name in EFFECTS:
+        samples = synthesize(name)
+        peak = max(abs(sample) for sample in samples) or 1.0
+        frames = b"".join(struct.pack("<h", int(sample / peak * 0.8 * 32767)) for sample in samples)
+        with wave.open(effect_path(name), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(SAMPLE_RATE)
+            f.writeframes(frames)
+    return len(EFFECTS)
+
+
+class SoundEffects(QObject):
+    def __init__(self, voices=VOICES_PER_EFFECT, volume=1.0, parent=None):
+        super().__init__(parent)
+        # QtMultimedia is only loaded once effects are actually set up
+        from PyQt6.QtMultimedia import QSoundEffect
+        self._ready = QSoundEffect.Status.Ready
+        # effect name -> its voices, and when each voice was last asked to play
+        self._voices = {}
+        self._requested = {}
+        for name in EFFECTS:
+            pool = []
+            for _ in range(voices):
+                voice = QSoundEffect(self)
+                voice.setSource(QUrl.fromLocalFile(effect_path(name)))
+                voice.setVolume(volume)
+                voice.playingChanged.connect(lambda voice=voice: self._on_playing_changed(voice))
+                pool.append(voice)
+            self._voices[name] = pool
+
+    def play(self, name):
+        with perf.timed("sound_effects.play"):
+            pool = self._voices[name]
+            # A free voice if there is one, otherwise restart the one that started first
+            voice = next((voice for voice in pool if not voice.isPlaying()), None)
+            if voice is None:
+                voice = min(pool, key=lambda voice: self._requested.get(voice, 0.0))
+                perf.count("sound_effects.voices_stolen")
+            if voice.status() != self._ready:
+                perf.count("sound_effects.not_ready")
+                return
+            self._requested[voice] = time.perf_counter()
+            voice.play()
+
+    def set_volume(self, volume):
+        for pool in self._voices.values():
+            for voice in pool:
+                voice.setVolume(volume)
+
+    def is_ready(self):
+        return all(voice.status() == self._ready
+                   for pool in self._voices.values() for voice in pool)
+
+    def _on_playing_changed(self, voice):
+        requested = self._requested.get(voice)
+        if voice.isPlaying() and requested is not None:
+            perf.record("sound_effects.latency", time.perf_counter() - requested)
+
+
+_sound_effects = None
+
+
+def sound_effects():
+    # The process-wide effects, created on first use (it needs a QApplication)
+    global _sound_effects
+    if _sound_effects is None:
+        _sound_effects = SoundEffects()
+    return _sound_effects
@@ -0,0 +1,44 @@
+from PyQt6.QtCore import QEvent, QObject, QTimer
+import os
+import time
+
+import perf
+
+# Startup timing and deferred initialization.
+# main.py imports this module first, so START is (close to) process start.
+# Only the welcome screen is built before the first frame; multimedia, the
+# custom font and the game window module are set up right after that frame
+# is painted (after_first_paint). Two timings are recorded through perf:
+#   startup.first_paint  - the welcome screen is on screen
+#   startup.interactive  - music, font and game module are ready as well
+# Run with LUDO_PERF=1 to have them printed.
+
+START = time.perf_counter()
+
+
+def mark(name):
+    # Record the time since START as the "startup.<name>" timing
+    elapsed = time.perf_counter() - START
+    perf.record(f"startup.{name}", elapsed)
+    if os.environ.get("LUDO_PERF"):
+        print(f"startup: {name} after {elapsed * 1000:.1f} ms")
+    return elapsed
+
+
+class _FirstPaint(QObject):
+    def __init__(self, widget, callback):
+        super().__init__(widget)
+        self.callback = callback
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            obj.removeEventFilter(self)
+            # Run once this paint has been delivered, not in the middle of it
+            QTimer.singleShot(0, self.callback)
+        return False
+
+
+def after_first_paint(widget, callback):
+    # Call `callback` from the event loop once `widget` has painted for the first time
+    _FirstPaint(widget, callback)
@@ -0,0 +1,146 @@
+from PyQt6.QtWidgets import (QFrame, QGraphicsPixmapItem, QGraphicsScene,
+                             QGraphicsSimpleTextItem, QGraphicsView)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPainter, QTransform
+
+# Scene-based table renderer.
+# The default table shows each card as a QLabel in a QHBoxLayout: a full
+# widget, a layout pass per change and, while it fades, a graphics effect with
+# its own offscreen buffer. CardTable draws the cards as pixmap items in one
+# QGraphicsScene instead. Items share the cached pixmaps from pixmap_cache, and
+# fades and flips set the item's own opacity and transform, so dozens of cards
+# can animate at once without any widgets or effects.
+#
+# A TableHand is one row of cards. It can be passed to CardDisplay.add_card()
+# wherever a QHBoxLayout is accepted, and CardDisplay.animate_card_deal()/
+# animate_card_flip() animate its items.
+#
+# Compare frame times with the label renderer:
+#     python tools.py bench-table --cards 40
+
+CARD_SPACING = 8
+ROW_SPACING = 10
+
+
+class CardItem(QGraphicsPixmapItem):
+    # One card on a CardTable. setPixmap()/setText() match the QLabel calls
+    # CardDisplay makes, so it can show cards on either.
+    def __init__(self):
+        super().__init__()
+        self.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+        # The hand it's in; None once it's been taken off the table
+        self.hand = None
+        self.text_item = None
+
+    def setPixmap(self, pixmap):
+        super().setPixmap(pixmap)
+        if self.text_item is not None:
+            self.text_item.setText("")
+        if self.hand is not None:
+            self.hand.relayout()
+
+    def setText(self, text):
+        # Text fallback for a card image that couldn't be loaded
+        if self.text_item is None:
+            self.text_item = QGraphicsSimpleTextItem(self)
+        self.text_item.setText(text)
+
+    def isHidden(self):
+        return self.hand is None
+
+    def set_flip(self, amount):
+        # Squash horizontally around the card's centre: 1.0 is flat on the
+        # table, 0.0 is edge-on halfway through a flip
+        half_width = self.boundingRect().width() / 2
+        self.setTransform(QTransform().translate(half_width, 0).scale(amount, 1.0)
+                          .translate(-half_width, 0))
+
+
+class TableHand:
+    # One row of cards on a CardTable
+    def __init__(self, table, row):
+        self.table = table
+        self.row = row
+        self.items = []
+
+    def add(self, item):
+        item.hand = self
+        self.table.scene().addItem(item)
+        self.items.append(item)
+        self.table.relayout()
+
+    def remove(self, item):
+        if item not in self.items:
+            return
+        self.items.remove(item)
+        self.table.scene().removeItem(item)
+        item.hand = None
+        self.table.relayout()
+
+    def clear(self):
+        for item in list(self.items):
+            self.remove(item)
+
+    # The parts of the QLayout API that MainWindow.sync_hand uses
+    def count(self):
+        return len(self.items)
+
+    def removeWidget(self, item):
+        self.remove(item)
+
+    def parentWidget(self):
+        return self.table
+
+    def height(self):
+        return max((item.boundingRect().height() for item in self.items), default=0.0)
+
+    def relayout(self):
+        self.table.relayout()
+
+    def place(self, top, width):
+        # Lay the cards out left to right from `top`, centred in `width`.
+        # A hand too long for the view overlaps its cards instead of running
+        # off the edge.
+        if not self.items:
+            return
+        card_width = max(item.boundingRect().width() for item in self.items)
+        step = card_width + CARD_SPACING
+        if len(self.items) > 1 and step * (len(self.items) - 1) + card_width > width:
+            step = max(1.0, (width - card_width) / (len(self.items) - 1))
+        left = max(0.0, (width - step * (len(self.items) - 1) - card_width) / 2)
+        for i, item in enumerate(self.items):
+            item.setPos(left + i * step, top)
+            item.setZValue(i)
+
+
+class CardTable(QGraphicsView):
+    def __init__(self, rows=1, parent=None):
+        super().__init__(parent)
+        self.setObjectName("cardTable")
+        self.setScene(QGraphicsScene(self))
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # The scene is as wide as the view, so this centres the rows vertically
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        # Only repaint around the items that changed, and don't save/restore
+        # painter state per item (pixmap items leave it untouched)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState)
+        self.hands = [TableHand(self, row) for row in range(rows)]
+
+    def hand(self, row=0):
+        return self.hands[row]
+
+    def relayout(self):
+        width = self.viewport().width()
+        top = 0.0
+        for hand in self.hands:
+            hand.place(top, width)
+            top += hand.height() + ROW_SPACING
+        self.scene().setSceneRect(0, 0, width, max(0.0, top - ROW_SPACING))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.relayout()
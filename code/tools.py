@@ -0,0 +1,341 @@
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+import perf
+
+# Developer tools: asset builders and benchmarks, kept out of the app modules.
+#
+# Rebuild generated assets:
+#     python tools.py build-atlas        after changing a card image
+#     python tools.py check-atlas        fail if the atlas is older than the card PNGs
+#     python tools.py build-sounds       after changing sound_effects.synthesize()
+#     python tools.py clear-card-cache   delete the on-disk card image cache
+# Measure:
+#     python tools.py bench-stylesheet   per-window vs app-level QSS
+#     python tools.py bench-animations   card paint cost with/without opacity effects
+#     python tools.py bench-table        label vs scene renderer frame times
+#     python tools.py bench-atlas        cold card loads, separate files vs atlas
+#     python tools.py bench-disk-cache   cold card loads, decode + scale vs disk cache
+#     python tools.py bench-sounds       sound effect playback latency
+#     python tools.py bench-shuffle      random.shuffle vs pre-generated shuffles
+# Each command takes --help for its options.
+
+
+def build_atlas(args):
+    from card_atlas import ATLAS_IMAGE, build_atlas
+    print(f"Packed {build_atlas()} images into {ATLAS_IMAGE}")
+
+
+def check_atlas(args):
+    from card_atlas import ATLAS_INDEX, atlas_is_current
+    if not atlas_is_current():
+        sys.exit(f"{ATLAS_INDEX} is out of date: run python tools.py build-atlas")
+    print("Atlas is up to date")
+
+
+def build_sounds(args):
+    from sound_effects import SOUNDS_DIR, build_sounds
+    print(f"Wrote {build_sounds()} effects to {SOUNDS_DIR}")
+
+
+def clear_card_cache(args):
+    from card_disk_cache import cache_dir
+    directory = cache_dir()
+    for name in os.listdir(directory) if os.path.isdir(directory) else []:
+        if name.startswith("cards-"):
+            os.remove(os.path.join(directory, name))
+    print(f"Cleared {directory}")
+
+
+def bench_stylesheet(args):
+    # Compare the old per-window styling against the app-level stylesheet:
+    # - a window switch: reading the file + setStyleSheet on the new window
+    # - a deal through CardDisplay.add_card: with the old setStyleSheet("") on
+    #   each card label under per-window QSS, and as it is now under app-level QSS
+    from PyQt6.QtWidgets import QApplication, QHBoxLayout, QLabel, QMainWindow, QVBoxLayout, QWidget
+    from app_style import STYLESHEET_PATH, apply_app_stylesheet
+    from card_display import CardDisplay
+
+    def build_window():
+        window = QMainWindow()
+        central = QWidget()
+        layout = QVBoxLayout(central)
+        for _ in range(args.cards):
+            label = QLabel("card")
+            label.setObjectName("cardLabel")
+            layout.addWidget(label)
+        hand = QHBoxLayout()
+        layout.addLayout(hand)
+        window.setCentralWidget(central)
+        window.show()
+        QApplication.processEvents()
+        return window, hand
+
+    def time_deals(hand, per_card_style):
+        display = CardDisplay()
+        elapsed = 0.0
+        for _ in range(args.deals):
+            display.clear_layout(hand)
+            QApplication.processEvents()
+            start = time.perf_counter()
+            for card in range(args.cards):
+                label = display.add_card(hand, card, animate=False)
+                if per_card_style:
+                    label.setStyleSheet("")
+            QApplication.processEvents()
+            elapsed += time.perf_counter() - start
+        return elapsed / args.deals
+
+    start = time.perf_counter()
+    for _ in range(args.windows):
+        window, hand = build_window()
+        with open(STYLESHEET_PATH, "r") as f:
+            window.setStyleSheet(f.read())
+        QApplication.processEvents()
+        window.close()
+    per_window_old = (time.perf_counter() - start) / args.windows
+
+    window, hand = build_window()
+    with open(STYLESHEET_PATH, "r") as f:
+        window.setStyleSheet(f.read())
+    per_deal_old = time_deals(hand, True)
+    window.close()
+
+    apply_app_stylesheet()
+    start = time.perf_counter()
+    for _ in range(args.windows):
+        window, hand = build_window()
+        QApplication.processEvents()
+        window.close()
+    per_window_new = (time.perf_counter() - start) / args.windows
+
+    window, hand = build_window()
+    per_deal_new = time_deals(hand, False)
+    window.close()
+
+    print(f"window switch: {per_window_old * 1000:.2f} ms per-window QSS, "
+          f"{per_window_new * 1000:.2f} ms app-level QSS")
+    print(f"deal of {args.cards} cards: {per_deal_old * 1000:.2f} ms with per-card "
+          f"setStyleSheet(\"\"), {per_deal_new * 1000:.2f} ms with app-level QSS")
+
+
+def bench_animations(args):
+    # Paint cost of a row of cards that keep an opacity effect after their
+    # animation (the old behaviour) against the same cards without one.
+    from PyQt6.QtWidgets import QApplication, QGraphicsOpacityEffect, QHBoxLayout, QLabel, QWidget
+    from card_display import pixmap_cache
+
+    container = QWidget()
+    layout = QHBoxLayout(container)
+    labels = []
+    for i in range(args.cards):
+        label = QLabel()
+        label.setPixmap(pixmap_cache.face(i % 52))
+        layout.addWidget(label)
+        labels.append(label)
+    container.resize(60 * args.cards, 200)
+    container.show()
+    QApplication.processEvents()
+
+    for title, with_effects in (("with leftover effects", True), ("without effects", False)):
+        for label in labels:
+            if with_effects:
+                effect = QGraphicsOpacityEffect(label)
+                effect.setOpacity(1.0)
+                label.setGraphicsEffect(effect)
+            else:
+                label.setGraphicsEffect(None)
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            container.grab()
+        elapsed = time.perf_counter() - start
+        print(f"{title:>22}: {elapsed / args.frames * 1000:.2f} ms per full repaint "
+              f"of {args.cards} cards")
+
+
+def bench_table(args):
+    # Frame time with `cards` cards all fading at once: QLabels with opacity
+    # effects in a layout (the label renderer mid-animation) against items in
+    # a CardTable with item opacity
+    from PyQt6.QtWidgets import QApplication, QGraphicsOpacityEffect, QGridLayout, QLabel, QWidget
+    from card_display import pixmap_cache
+    from table_view import CardItem, CardTable
+
+    cards = args.cards
+    columns = 10
+    rows = (cards + columns - 1) // columns
+
+    labels_window = QWidget()
+    grid = QGridLayout(labels_window)
+    effects = []
+    for i in range(cards):
+        label = QLabel()
+        label.setPixmap(pixmap_cache.face(i % 52))
+        effect = QGraphicsOpacityEffect(label)
+        label.setGraphicsEffect(effect)
+        effects.append(effect)
+        grid.addWidget(label, i // columns, i % columns)
+
+    table = CardTable(rows=rows)
+    items = []
+    for i in range(cards):
+        item = CardItem()
+        item.setPixmap(pixmap_cache.face(i % 52))
+        table.hand(i // columns).add(item)
+        items.append(item)
+
+    for title, window, canvas, set_opacity in (
+            ("labels + effects", labels_window, labels_window,
+             lambda i, value: effects[i].setOpacity(value)),
+            ("scene items", table, table.viewport(),
+             lambda i, value: items[i].setOpacity(value))):
+        window.resize(1300, 200 * rows)
+        window.show()
+        QApplication.processEvents()
+        start = time.perf_counter()
+        for frame in range(args.frames):
+            for i in range(cards):
+                set_opacity(i, 0.5 + 0.5 * math.sin(frame / 5 + i))
+            canvas.repaint()
+        elapsed = (time.perf_counter() - start) / args.frames
+        print(f"{title:>16}: {elapsed * 1000:.2f} ms per frame with {cards} cards fading "
+              f"({1 / elapsed:.0f} fps)")
+        window.hide()
+
+
+def bench_atlas(args):
+    # Cold-load card images into fresh caches, once from the separate PNG
+    # files and once from the atlas, and report time and file reads:
+    # - one card on demand (a lone card never waits for the whole atlas)
+    # - every card at once, as preload() does
+    from PyQt6.QtGui import QImage
+    from card_atlas import CARDS_DIR
+    from card_display import CardPixmapCache
+
+    backs = [name for name in os.listdir(CARDS_DIR) if name.startswith("cardBack_")]
+    # Load Qt's PNG support and PyQt's enums first so neither run pays for them
+    CardPixmapCache(use_atlas=False, use_disk_cache=False).scaled(
+        QImage(os.path.join(CARDS_DIR, "cardJoker.png")))
+    for label, use_atlas in (("separate files", False), ("atlas", True)):
+        perf.reset()
+        start = time.perf_counter()
+        CardPixmapCache(use_atlas=use_atlas, use_disk_cache=False).face(0)
+        first = time.perf_counter() - start
+        first_reads = perf.counters.get("card_images.file_reads", 0)
+
+        perf.reset()
+        start = time.perf_counter()
+        CardPixmapCache(use_atlas=use_atlas, use_disk_cache=False).preload(backs)
+        total = time.perf_counter() - start
+        print(f"{label:>14}: first card {first * 1000:.1f} ms ({first_reads} file reads), "
+              f"all cards {total * 1000:.1f} ms "
+              f"({perf.counters.get('card_images.file_reads', 0)} file reads)")
+
+
+def bench_disk_cache(args):
+    # Cold-load every face into a fresh pixmap cache from the atlas, then
+    # again from the disk cache that load left behind
+    from PyQt6.QtGui import QGuiApplication, QImage
+    from card_atlas import CARDS_DIR
+    from card_disk_cache import cache_path
+    from card_display import CardPixmapCache, DEFAULT_BUCKET, DEFAULT_CARD_BACK
+
+    dpr = QGuiApplication.primaryScreen().devicePixelRatio()
+    path = cache_path(DEFAULT_BUCKET, dpr)
+    if os.path.exists(path):
+        os.remove(path)
+    QImage(os.path.join(CARDS_DIR, "cardJoker.png"))  # Load Qt's PNG support first
+    for label in ("decode + scale", "disk cache"):
+        perf.reset()
+        cache = CardPixmapCache()
+        start = time.perf_counter()
+        cache.preload([DEFAULT_CARD_BACK], DEFAULT_BUCKET, dpr)
+        elapsed = time.perf_counter() - start
+        print(f"{label:>14}: all cards {elapsed * 1000:.1f} ms, "
+              f"{perf.counters.get('card_images.file_reads', 0)} file reads")
+    print(f"cache file: {path} ({os.path.getsize(path) // 1024} KiB)")
+
+
+def bench_sounds(args):
+    # Play a burst of deals `interval` ms apart once every voice is loaded,
+    # then report the play() cost and latency recorded through perf
+    from PyQt6.QtCore import QCoreApplication, QTimer
+    from sound_effects import sound_effects
+
+    effects = sound_effects()
+    while not effects.is_ready():
+        QCoreApplication.processEvents()
+        time.sleep(0.001)
+    perf.reset()
+
+    for i in range(args.deals):
+        QTimer.singleShot(i * args.interval, lambda: effects.play("deal"))
+    QTimer.singleShot(args.deals * args.interval + 500, QCoreApplication.quit)
+    QCoreApplication.exec()
+    print(perf.report())
+
+
+def bench_shuffle(args):
+    # Time reshuffling a shoe with random.shuffle against pre-generated batches
+    from shoe import Shoe, ShuffleBatches
+
+    for label, rng in (("random.shuffle", random.Random(0)), ("ShuffleBatches", ShuffleBatches(0))):
+        shoe = Shoe(args.decks, rng=rng)
+        start = time.perf_counter()
+        for _ in range(args.shuffles):
+            shoe.shuffle()
+        elapsed = time.perf_counter() - start
+        print(f"{label:>14}: {elapsed / args.shuffles * 1e6:.1f} us per "
+              f"{args.decks}-deck shoe shuffle")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Game of 21 asset builders and benchmarks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def command(name, function, help, qt=True):
+        # `qt`: whether the command needs a QApplication
+        subparser = commands.add_parser(name, help=help)
+        subparser.set_defaults(function=function, qt=qt)
+        return subparser
+
+    command("build-atlas", build_atlas, "pack the card PNGs into the sprite atlas")
+    command("check-atlas", check_atlas, "fail if the atlas is older than the card PNGs", qt=False)
+    command("build-sounds", build_sounds, "write the sound effect WAVs", qt=False)
+    command("clear-card-cache", clear_card_cache, "delete the on-disk card image cache")
+
+    stylesheet = command("bench-stylesheet", bench_stylesheet, "per-window vs app-level QSS")
+    stylesheet.add_argument("--windows", type=int, default=20)
+    stylesheet.add_argument("--cards", type=int, default=6)
+    stylesheet.add_argument("--deals", type=int, default=20)
+
+    animations = command("bench-animations", bench_animations,
+                         "card paint cost with and without opacity effects")
+    animations.add_argument("--cards", type=int, default=40)
+    animations.add_argument("--frames", type=int, default=100)
+
+    table = command("bench-table", bench_table, "label vs scene renderer frame times")
+    table.add_argument("--cards", type=int, default=40)
+    table.add_argument("--frames", type=int, default=60)
+
+    command("bench-atlas", bench_atlas, "cold card loads, separate files vs atlas")
+    command("bench-disk-cache", bench_disk_cache, "cold card loads, decode + scale vs disk cache")
+
+    sounds = command("bench-sounds", bench_sounds, "sound effect playback latency")
+    sounds.add_argument("--deals", type=int, default=40)
+    sounds.add_argument("--interval", type=int, default=50, help="ms between deals")
+
+    shuffle = command("bench-shuffle", bench_shuffle, "random.shuffle vs pre-generated shuffles",
+                      qt=False)
+    shuffle.add_argument("--shuffles", type=int, default=100000)
+    shuffle.add_argument("--decks", type=int, default=1)
+
+    args = parser.parse_args()
+    if args.qt:
+        from PyQt6.QtWidgets import QApplication
+        app = QApplication(sys.argv)
+    args.function(args)
@@ -1,35 +1,30 @@
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QLabel, QPushButton, 
-                             QVBoxLayout, QWidget, QGraphicsOpacityEffect)
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QUrl
-from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
-from PyQt6.QtGui import QPixmap,  QFont, QFontDatabase
+                             QVBoxLayout, QWidget)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
 import os
 
-from music_manager import MusicManager
+from app_style import apply_app_stylesheet
+from animation_manager import IdleAnimationGuard, PulseAnimation
+
+ULTRA_FONT_PATH = os.path.join(os.path.dirname(__file__), "assets", "font", "Ultra-Regular.ttf")
+
+
+def ultra_font_family():
+    # Register the Ultra font the first time it's needed; returns its family name
+    from preloader import register_font
+    return register_font(ULTRA_FONT_PATH) or "Ultra"
+
 
 class WelcomeWindow(QMainWindow):
-    def __init__(self, music_player=None, audio_output=None):
+    def __init__(self, shell):
         super().__init__()
+        # AppShell hosting this page (see app_shell.py)
+        self.shell = shell
         self.setWindowTitle("LUDO - Ready to gamble?")
         
-        # Load custom font first
-        font_path = os.path.join(os.path.dirname(__file__), "assets", "font", "Ultra-Regular.ttf")
-        font_id = QFontDatabase.addApplicationFont(font_path)
-        font_families = QFontDatabase.applicationFontFamilies(font_id)
-        if font_families:
-            self.ultra_font_family = font_families[0]
-        else:
-            self.ultra_font_family = "Ultra"
-        
-        # Set window size
-        self.resize(400, 300)
+        # Size the shell takes while this page is shown (it also centers it)
         self.setMinimumSize(400, 300)
-        # Center the window on screen
-        screen = QApplication.primaryScreen().geometry()
-        window_geometry = self.frameGeometry()
-        center_point = screen.center()
-        window_geometry.moveCenter(center_point)
-        self.move(window_geometry.topLeft())
         
         # Create central widget and layout
         central_widget = QWidget()
@@ -40,15 +35,14 @@ class WelcomeWindow(QMainWindow):
         # Add spacing at top
         layout.addStretch()
         
-        # Title
-        title = QLabel("LUDO")
-        title.setObjectName("titleLabel")
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        font = QFont(self.ultra_font_family, 48)
-        font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
-        title.setFont(font)
-        print(f"Using font family: {self.ultra_font_family}")
-        layout.addWidget(title)
+        # Title (gets the Ultra font once the preloader has loaded it)
+        self.title = QLabel("LUDO")
+        self.title.setObjectName("titleLabel")
+        self.title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        font = self.title.font()
+        font.setPointSize(48)
+        self.title.setFont(font)
+        layout.addWidget(self.title)
         
         # Subtitle
         subtitle = QLabel("Game of 21")
@@ -71,16 +65,8 @@ class WelcomeWindow(QMainWindow):
         start_button.clicked.connect(self.start_game)
         layout.addWidget(start_button)
         
-        # Add pulsating animation to start button
-        self.start_opacity_effect = QGraphicsOpacityEffect()
-        start_button.setGraphicsEffect(self.start_opacity_effect)
-        self.start_animation = QPropertyAnimation(self.start_opacity_effect, b"opacity")
-        self.start_animation.setDuration(3000)
-        self.start_animation.setStartValue(0.6)
-        self.start_animation.setKeyValueAt(0.5, 1.0)
-        self.start_animation.setEndValue(0.6)
-        self.start_animation.setEasingCurve(QEasingCurve.Type.InOutSine)
-        self.start_animation.setLoopCount(-1)  # Loops forever
+        # Add pulsating animation to start button (paused while the window is idle)
+        self.start_animation = PulseAnimation(start_button, 0.6, 1.0)
         self.start_animation.start()
         
         layout.addSpacing(10)
@@ -96,55 +82,64 @@ class WelcomeWindow(QMainWindow):
         layout.addWidget(exit_button)
         
         # Add pulsating animation to exit button
-        self.exit_opacity_effect = QGraphicsOpacityEffect()
-        exit_button.setGraphicsEffect(self.exit_opacity_effect)
-        self.exit_animation = QPropertyAnimation(self.exit_opacity_effect, b"opacity")
-        self.exit_animation.setDuration(3000)
-        self.exit_animation.setStartValue(1.0)
-        self.exit_animation.setKeyValueAt(0.5, 0.6)
-        self.exit_animation.setEndValue(1.0)
-        self.exit_animation.setEasingCurve(QEasingCurve.Type.InOutSine)
-        self.exit_animation.setLoopCount(-1)  # Loop forever
+        self.exit_animation = PulseAnimation(exit_button, 1.0, 0.6)
         self.exit_animation.start()
         
+        # Pause the pulses while hidden, minimized or unfocused; stop them on close
+        self.animation_guard = IdleAnimationGuard(self, [self.start_animation, self.exit_animation])
+        
         # Add spacing at bottom
         layout.addStretch()
         
         # Load stylesheet
         self.load_stylesheet()
         
-        # Use existing music player or create new one
-        if music_player and audio_output:
-            self.music_player = music_player
-            self.audio_output = audio_output
-        else:
-            music_mgr = MusicManager()
-            music_mgr.play()
-            self.music_player = music_mgr.get_player()
-            self.audio_output = music_mgr.get_audio_output()
-            self.audio_output.setVolume(0.3)
-        
-        # Reference to the game window (will be created when start is clicked)
-        self.game_window = None
+        # finish_startup is run by the shell once this page has painted
+        self.started = False
+    
+    def finish_startup(self):
+        # The parts of startup that can wait until the window is on screen:
+        # the custom font, the game's assets and the music (which pulls in
+        # QtMultimedia)
+        if self.started:
+            return
+        self.started = True
+        
+        # Load the font, card images and stylesheet in the background while
+        # this screen is shown
+        from preloader import AssetPreloader
+        self.preloader = AssetPreloader(fonts=[ULTRA_FONT_PATH], parent=self)
+        self.preloader.loaded.connect(self.on_asset_loaded)
+        self.preloader.start()
+        if ULTRA_FONT_PATH not in self.preloader.fonts:
+            self.apply_title_font()  # Registered by an earlier welcome window
+        
+        # The shared music; keeps playing if it already is
+        from music_manager import music_manager
+        music_manager().play()
+        
+        # Load the game's sound effects now, so the first deal can play at once
+        from sound_effects import sound_effects
+        sound_effects()
+    
+    def on_asset_loaded(self, name):
+        if name == ULTRA_FONT_PATH:
+            self.apply_title_font()
+    
+    def apply_title_font(self):
+        font = QFont(ultra_font_family(), 48)
+        font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
+        self.title.setFont(font)
+        print(f"Using font family: {font.family()}")
     
     def load_stylesheet(self):
-        # Load stylesheet from file
-        stylesheet_path = os.path.join(os.path.dirname(__file__), "stylesheet.qss")
-        try:
-            with open(stylesheet_path, "r") as f:
-                self.setStyleSheet(f.read())
-        except FileNotFoundError:
-            print(f"Warning: Stylesheet file not found at {stylesheet_path}")
+        # The stylesheet is read once and applied to the whole application,
+        # so this window doesn't need its own copy
+        apply_app_stylesheet()
     
     def start_game(self):
-        # Import here to avoid circular dependency
-        from main import MainWindow
-        
-        # Create and show the main game window, passing the music player
-        self.game_window = MainWindow(music_player=self.music_player, audio_output=self.audio_output)
-        self.game_window.show()
-        # Close the welcome window
-        self.close()
+        # Switch the shell to the (reused) game page
+        self.shell.show_game()
     
     def exit_game(self):
         # Close the application